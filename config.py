@@ -6,6 +6,7 @@ from pydantic_settings import BaseSettings
 from pydantic import Field
 from typing import List, Optional
 from pathlib import Path
+from functools import lru_cache
 from dotenv import load_dotenv
 import os
 
@@ -156,25 +157,18 @@ def create_settings():
     
     return settings
 
-# Create the global settings instance
-_settings = None
-
+@lru_cache(maxsize=1)
 def get_settings():
-    """Get application settings - always returns fresh instance"""
-    global _settings
-    if _settings is None:
-        _settings = create_settings()
-    return _settings
+    """Get application settings - parsed once and cached"""
+    return create_settings()
 
 def reload_settings():
     """Force reload settings"""
-    global _settings
-    _settings = None
-    _settings = create_settings()
-    return _settings
+    get_settings.cache_clear()
+    return get_settings()
 
 # Create initial instance
-settings = create_settings()
+settings = get_settings()
 
 # Validation function
 def validate_configuration():
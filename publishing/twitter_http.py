@@ -0,0 +1,185 @@
+"""
+Shared async HTTP transport for Twitter publishing
+One pooled httpx client with OAuth 1.0a request signing, reused by every publisher
+"""
+
+import base64
+import hashlib
+import hmac
+import secrets
+import time
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Dict, NamedTuple, Optional, Tuple
+from urllib.parse import quote
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+API_BASE = "https://api.twitter.com"
+
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+
+class OAuth1Credentials(NamedTuple):
+    """App and user key pairs used to sign a request"""
+    consumer_key: str
+    consumer_secret: str
+    token: str
+    token_secret: str
+
+
+class RateLimit(NamedTuple):
+    """Rate limit window reported in a response's x-rate-limit-* headers"""
+    remaining: Optional[int]
+    reset: Optional[float]  # epoch seconds when the window resets
+
+
+def rate_limit(response: httpx.Response) -> RateLimit:
+    """Read the rate limit headers of a response (None when absent)"""
+    remaining = response.headers.get("x-rate-limit-remaining")
+    reset = response.headers.get("x-rate-limit-reset")
+    return RateLimit(
+        int(remaining) if remaining is not None else None,
+        float(reset) if reset is not None else None
+    )
+
+
+class TokenBucket:
+    """Client-side rate limiter refilling `rate` tokens per second up to `capacity`
+
+    Lets callers reject a request that would be rate limited without
+    spending a round-trip on a 429. Not thread-safe; meant for use from a
+    single event loop.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def available(self) -> float:
+        """Tokens currently in the bucket"""
+        self._refill()
+        return self.tokens
+
+    def try_acquire(self) -> bool:
+        """Take one token if available"""
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def next_refill(self) -> float:
+        """Seconds until the next token is available"""
+        self._refill()
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=15,
+            limits=httpx.Limits(max_keepalive_connections=8)
+        )
+    return _client
+
+
+async def aclose():
+    """Close the shared client and its pooled connections"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+@lru_cache(maxsize=1)
+def get_requests_session() -> requests.Session:
+    """One requests session for every tweepy client, so they share a TLS pool
+
+    Idempotent requests are retried with backoff; POSTs are never retried,
+    so a tweet can't be posted twice.
+    """
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+    ))
+    return session
+
+
+def _encode(value) -> str:
+    """RFC 3986 percent-encoding as required by OAuth 1.0a"""
+    return quote(str(value), safe="")
+
+
+def oauth1_header(method: str, url: str, params: Dict[str, str], credentials: OAuth1Credentials) -> str:
+    """Build an HMAC-SHA1 signed OAuth 1.0a Authorization header
+
+    params are the query/form parameters; JSON bodies are not signed.
+    """
+    oauth_params = {
+        "oauth_consumer_key": credentials.consumer_key,
+        "oauth_nonce": secrets.token_hex(16),
+        "oauth_signature_method": "HMAC-SHA1",
+        "oauth_timestamp": str(int(time.time())),
+        "oauth_token": credentials.token,
+        "oauth_version": "1.0",
+    }
+
+    encoded = sorted(
+        (_encode(key), _encode(value))
+        for key, value in {**params, **oauth_params}.items()
+    )
+    parameter_string = "&".join(f"{key}={value}" for key, value in encoded)
+    base_string = "&".join([method.upper(), _encode(url), _encode(parameter_string)])
+    signing_key = f"{_encode(credentials.consumer_secret)}&{_encode(credentials.token_secret)}"
+
+    digest = hmac.new(signing_key.encode(), base_string.encode(), hashlib.sha1).digest()
+    oauth_params["oauth_signature"] = base64.b64encode(digest).decode()
+
+    return "OAuth " + ", ".join(
+        f'{_encode(key)}="{_encode(value)}"' for key, value in sorted(oauth_params.items())
+    )
+
+
+async def update_status(credentials: OAuth1Credentials, status: str) -> Tuple[Dict, RateLimit]:
+    """Post a tweet through API v1.1 and return the created status and rate limit"""
+    url = f"{API_BASE}/1.1/statuses/update.json"
+    data = {"status": status}
+    response = await get_client().post(
+        url,
+        data=data,
+        headers={"Authorization": oauth1_header("POST", url, data, credentials)}
+    )
+    response.raise_for_status()
+    return response.json(), rate_limit(response)
+
+
+async def create_tweet(credentials: OAuth1Credentials, text: str) -> Dict:
+    """Post a tweet through API v2 and return the response payload"""
+    url = f"{API_BASE}/2/tweets"
+    response = await get_client().post(
+        url,
+        json={"text": text},
+        headers={"Authorization": oauth1_header("POST", url, {}, credentials)}
+    )
+    response.raise_for_status()
+    return response.json()
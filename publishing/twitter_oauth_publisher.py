@@ -3,30 +3,80 @@ Fixed Twitter OAuth Integration for Freyja Dashboard
 Uses API v1.1 which works with FREE Twitter tier
 """
 
+import httpx
 import tweepy
 import os
 import logging
 from typing import Optional, Dict
-import json
+import orjson
+import threading
+import time
+from dataclasses import dataclass, field, replace
 from datetime import datetime
+from functools import lru_cache
+
+from publishing import twitter_http
 
 logger = logging.getLogger(__name__)
 
+# How long verified account details are trusted before re-verifying
+USER_INFO_TTL = 900
+
+TOKEN_FILE = 'data/twitter_user_tokens.json'
+
+CALLBACK_URL = "http://localhost:8000/twitter/callback"
+
+# Authorizations started but not yet completed, keyed by request token
+PENDING_AUTH_TTL = 600
+PENDING_AUTH_MAX = 1024
+
+# statuses/update allows 300 posts per 3 hours per user; allow short bursts
+PUBLISH_RATE = 300 / (3 * 60 * 60)
+PUBLISH_BURST = 15
+
+@lru_cache(maxsize=1)
+def _app_credentials() -> tuple:
+    """(app key, app secret), read once on first construction rather than at import"""
+    return os.getenv('TWITTER_APP_KEY'), os.getenv('TWITTER_APP_SECRET')
+
+@dataclass(frozen=True)
+class _ClientBundle:
+    """Connection state that is replaced as a whole, never mutated
+    
+    Publishes read the bundle once and keep using that snapshot, so a
+    concurrent reconnect can't hand them a client from one account and user
+    info from another. Per-account rate limit counters are the only state
+    updated in place.
+    """
+    client: Optional[tweepy.API] = None  # API v1.1 client
+    user_info: Optional[Dict] = None
+    accounts: Dict = field(default_factory=dict)  # pool, see _register_account
+    primary: Optional[tuple] = None  # pool key of the connected account
+
 class TwitterOAuthPublisher:
     """Fixed Twitter OAuth integration - uses v1.1 API for free tier"""
     
-    def __init__(self):
+    def __init__(self, rotate_accounts: bool = False):
+        """rotate_accounts: spread tweets over every saved token of the connected
+        user instead of only the connected token. Tweets always come from the
+        connected identity.
+        """
+        self.rotate_accounts = rotate_accounts
+        
         # App-level credentials
-        self.app_api_key = os.getenv('TWITTER_APP_KEY')
-        self.app_api_secret = os.getenv('TWITTER_APP_SECRET')
+        self.app_api_key, self.app_api_secret = _app_credentials()
         
         # User-specific tokens and info
         self.user_access_token = None
         self.user_access_secret = None
-        self.user_info = None
+        self._bundle = _ClientBundle()
+        self._bundle_lock = threading.Lock()
+        self._user_info_cached_at = None  # time.monotonic() of last verify
+        self._user_info_ttl = USER_INFO_TTL
+        self._last_token_blob = None  # last persisted tokens, to skip no-op writes
         
-        self.client = None  # This will be API v1.1 client
         self.auth_handler = None
+        self._pending_auth = {}  # oauth_token -> (expires_at, handler), oldest first
         
         # Initialize OAuth handler
         self._init_oauth()
@@ -34,68 +84,256 @@ class TwitterOAuthPublisher:
         # Try to load saved user tokens
         self._load_user_tokens()
     
+    @property
+    def client(self) -> Optional[tweepy.API]:
+        return self._bundle.client
+    
+    @property
+    def user_info(self) -> Optional[Dict]:
+        return self._bundle.user_info
+    
+    @property
+    def accounts(self) -> Dict:
+        """Authorized tokens of the connected user, keyed by (access_token, access_token_secret)
+        
+        With rotate_accounts, tweets are spread across them so each token's
+        rate limit adds up. Re-authorizing replaces the pool.
+        """
+        return self._bundle.accounts
+    
+    def _swap_bundle(self, **changes):
+        """Publish new connection state with a single attribute assignment"""
+        with self._bundle_lock:
+            self._bundle = replace(self._bundle, **changes)
+    
     def _init_oauth(self):
         """Initialize OAuth handler"""
+        if not self.app_api_key or not self.app_api_secret:
+            logger.error("Twitter app credentials not found in environment variables")
+            return
+        
         try:
-            if not self.app_api_key or not self.app_api_secret:
-                logger.error("Twitter app credentials not found in environment variables")
-                return
-            
-            callback_url = "http://localhost:8000/twitter/callback"
-            
-            self.auth_handler = tweepy.OAuth1UserHandler(
-                consumer_key=self.app_api_key,
-                consumer_secret=self.app_api_secret,
-                callback=callback_url
-            )
-            
-            logger.info(f"OAuth handler initialized with callback: {callback_url}")
+            self.auth_handler = self._new_auth_handler()
             
         except Exception as e:
             logger.error(f"Failed to initialize OAuth: {e}")
     
+    def _new_auth_handler(self) -> tweepy.OAuth1UserHandler:
+        """Fresh handler for one authorization flow"""
+        return tweepy.OAuth1UserHandler(
+            consumer_key=self.app_api_key,
+            consumer_secret=self.app_api_secret,
+            callback=CALLBACK_URL
+        )
+    
+    def _prune_pending_auth(self):
+        """Drop expired authorizations, and the oldest ones beyond the cap"""
+        now = time.monotonic()
+        for key, (expires_at, _) in list(self._pending_auth.items()):
+            if expires_at > now and len(self._pending_auth) < PENDING_AUTH_MAX:
+                break
+            del self._pending_auth[key]
+    
     def _load_user_tokens(self):
         """Load saved user tokens and info from file"""
+        # A single open both checks for and reads the file; only a damaged
+        # file is treated as an error
         try:
-            token_file = 'data/twitter_user_tokens.json'
-            if os.path.exists(token_file):
-                with open(token_file, 'r') as f:
-                    tokens = json.load(f)
-                    self.user_access_token = tokens.get('access_token')
-                    self.user_access_secret = tokens.get('access_token_secret')
-                    self.user_info = tokens.get('user_info')
-                    
-                    if self.user_access_token and self.user_access_secret:
-                        self._create_client()
-                        logger.info("Loaded saved Twitter user tokens and info")
-        except Exception as e:
+            with open(TOKEN_FILE, 'rb') as f:
+                tokens = orjson.loads(f.read())
+        except FileNotFoundError:
+            return
+        except (OSError, orjson.JSONDecodeError) as e:
             logger.error(f"Error loading user tokens: {e}")
+            return
+        
+        self.user_access_token = tokens.get('access_token')
+        self.user_access_secret = tokens.get('access_token_secret')
+        self._swap_bundle(user_info=tokens.get('user_info'))
+        if self.user_access_token and self.user_access_secret:
+            # Saved tokens of any other user are left out of the pool
+            user_id = self._user_id(self.user_info)
+            for account in tokens.get('accounts', []):
+                if (account.get('access_token') and account.get('access_token_secret')
+                        and user_id is not None and self._user_id(account.get('user_info')) == user_id):
+                    self._register_account(
+                        account['access_token'], account['access_token_secret'],
+                        account.get('user_info')
+                    )
+            self._register_account(
+                self.user_access_token, self.user_access_secret, self.user_info
+            )
+            self._swap_bundle(primary=(self.user_access_token, self.user_access_secret))
+        self._last_token_blob = self._token_blob(
+            self.user_access_token, self.user_access_secret, self.user_info
+        )
+        
+        # Recently saved account details are trusted as-is, so a
+        # restart doesn't cost a verify_credentials round-trip
+        age = self._token_age(tokens.get('saved_at'))
+        fresh = self.user_info is not None and age is not None and age < self._user_info_ttl
+        if fresh:
+            self._user_info_cached_at = time.monotonic() - age
+        
+        if self.user_access_token and self.user_access_secret:
+            self._create_client(verify=not fresh)
+            logger.info("Loaded saved Twitter user tokens and info")
+    
+    @staticmethod
+    def _token_age(saved_at) -> Optional[float]:
+        """Seconds since the token file was saved, if known
+        
+        saved_at is epoch seconds; files written by older versions hold an
+        ISO timestamp instead.
+        """
+        if isinstance(saved_at, (int, float)):
+            return time.time() - saved_at
+        try:
+            return time.time() - datetime.fromisoformat(saved_at).timestamp()
+        except (TypeError, ValueError):
+            return None
+    
+    def _user_info_fresh(self) -> bool:
+        """Whether cached user info is still within its TTL"""
+        return (
+            self.user_info is not None
+            and self._user_info_cached_at is not None
+            and time.monotonic() - self._user_info_cached_at < self._user_info_ttl
+        )
+    
+    def _verify_user(self) -> Dict:
+        """Fetch account details from Twitter and cache them"""
+        user = self.client.verify_credentials()
+        user_info = {
+            'username': user.screen_name,
+            'name': user.name,
+            'followers': user.followers_count,
+            'following': user.friends_count,
+            'profile_image': user.profile_image_url_https,
+            'user_id': user.id_str
+        }
+        self._swap_bundle(user_info=user_info)
+        self._user_info_cached_at = time.monotonic()
+        return user_info
+    
+    def _register_account(self, access_token: str, access_token_secret: str, user_info: Dict = None):
+        """Add an authorized account to the publishing pool (or refresh its info)"""
+        key = (access_token, access_token_secret)
+        previous = self.accounts.get(key, {})
+        account = {
+            'access_token': access_token,
+            'access_token_secret': access_token_secret,
+            'user_info': previous.get('user_info'),
+            'url_prefix': previous.get('url_prefix'),  # tweet URL up to the id, known once verified
+            'remaining': previous.get('remaining'),    # calls left in the current rate limit window
+            'reset': previous.get('reset', 0.0),       # epoch seconds when that window ends
+            'bucket': previous.get('bucket') or twitter_http.TokenBucket(PUBLISH_RATE, PUBLISH_BURST)
+        }
+        if user_info:
+            account['user_info'] = user_info
+            account['url_prefix'] = f"https://twitter.com/{user_info['username']}/status/"
+        # Copy-on-write so in-flight publishes keep their snapshot of the pool
+        self._swap_bundle(accounts={**self.accounts, key: account})
+    
+    @staticmethod
+    def _user_id(user_info: Optional[Dict]) -> Optional[str]:
+        return user_info.get('user_id') if user_info else None
+    
+    def _persisted_accounts(self) -> list:
+        """The pool as stored in the token file"""
+        return [
+            {
+                'access_token': account['access_token'],
+                'access_token_secret': account['access_token_secret'],
+                'user_info': account['user_info']
+            }
+            for account in self.accounts.values()
+        ]
+    
+    def _token_blob(self, access_token: str, access_token_secret: str, user_info: Dict = None) -> bytes:
+        """Canonical form of the persisted fields, used to detect changes"""
+        return orjson.dumps({
+            'access_token': access_token,
+            'access_token_secret': access_token_secret,
+            'user_info': user_info,
+            'accounts': self._persisted_accounts()
+        }, option=orjson.OPT_SORT_KEYS)
+    
+    def _pick_account(self, bundle: _ClientBundle) -> Optional[Dict]:
+        """Account to post from: the connected one, or with rotate_accounts the
+        token of the connected user with the most calls left in its window
+        
+        The server-reported window counts as unlimited once it has reset or
+        before the account has posted; the local token bucket always applies.
+        Accounts whose username isn't known yet are never picked.
+        """
+        primary = bundle.accounts.get(bundle.primary)
+        if primary is None or primary['url_prefix'] is None:
+            return None
+        if not self.rotate_accounts:
+            return primary
+        
+        user_id = self._user_id(primary['user_info'])
+        candidates = [
+            account for account in bundle.accounts.values()
+            if account['url_prefix'] is not None and self._user_id(account['user_info']) == user_id
+        ]
+        now = time.time()
+        
+        def headroom(account):
+            local = account['bucket'].available()
+            if account['remaining'] is None or now >= account['reset']:
+                return local
+            return min(account['remaining'], local)
+        
+        return max(candidates, key=headroom)
+    
+    @staticmethod
+    def _update_rate_limit(account: Dict, limit: twitter_http.RateLimit):
+        """Record the rate limit window reported for an account"""
+        if limit.remaining is not None:
+            account['remaining'] = limit.remaining
+        if limit.reset is not None:
+            account['reset'] = limit.reset
     
     def _save_user_tokens(self, access_token: str, access_token_secret: str, user_info: Dict = None):
-        """Save user tokens and info to file"""
+        """Save user tokens and info to file, skipping the write if nothing changed"""
         try:
+            blob = self._token_blob(access_token, access_token_secret, user_info)
+            if blob == self._last_token_blob:
+                return
+            
             os.makedirs('data', exist_ok=True)
             tokens = {
                 'access_token': access_token,
                 'access_token_secret': access_token_secret,
                 'user_info': user_info,
-                'saved_at': datetime.now().isoformat()
+                'accounts': self._persisted_accounts(),
+                'saved_at': int(time.time())
             }
             
-            with open('data/twitter_user_tokens.json', 'w') as f:
-                json.dump(tokens, f, indent=2)
-                
+            # Write a sibling file and swap it in so a crash never leaves a
+            # truncated token file behind
+            tmp_file = f"{TOKEN_FILE}.tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(tokens))
+            os.replace(tmp_file, TOKEN_FILE)
+            
+            self._last_token_blob = blob
             logger.info("Saved Twitter user tokens and info")
         except Exception as e:
             logger.error(f"Error saving user tokens: {e}")
     
-    def _create_client(self):
-        """Create Twitter API v1.1 client (works with free tier)"""
+    def _create_client(self, verify: bool = True):
+        """Create Twitter API v1.1 client (works with free tier)
+        
+        With verify=False the cached user info is kept and no API call is made.
+        """
+        if not all([self.app_api_key, self.app_api_secret, self.user_access_token, self.user_access_secret]):
+            logger.warning("Missing tokens for Twitter client creation")
+            return False
+        
         try:
-            if not all([self.app_api_key, self.app_api_secret, self.user_access_token, self.user_access_secret]):
-                logger.warning("Missing tokens for Twitter client creation")
-                return False
-            
             # Create OAuth 1.0a auth for API v1.1
             auth = tweepy.OAuth1UserHandler(
                 consumer_key=self.app_api_key,
@@ -105,19 +343,21 @@ class TwitterOAuthPublisher:
             )
             
             # Use API v1.1 client (works with free tier)
-            self.client = tweepy.API(auth, wait_on_rate_limit=True)
+            # Rate limits are enforced locally (see PUBLISH_RATE); never let
+            # tweepy sleep a caller for a whole rate limit window
+            client = tweepy.API(auth, wait_on_rate_limit=False)
+            client.session = twitter_http.get_requests_session()
+            
+            if not verify:
+                self._swap_bundle(client=client)
+                return True
             
             # Test connection and get user info
             try:
-                user = self.client.verify_credentials()
-                self.user_info = {
-                    'username': user.screen_name,
-                    'name': user.name,
-                    'followers': user.followers_count,
-                    'following': user.friends_count,
-                    'profile_image': user.profile_image_url_https,
-                    'user_id': user.id_str
-                }
+                self._swap_bundle(client=client)
+                self._verify_user()
+                self._register_account(self.user_access_token, self.user_access_secret, self.user_info)
+                self._swap_bundle(primary=(self.user_access_token, self.user_access_secret))
                 
                 # Save updated user info
                 self._save_user_tokens(
@@ -126,20 +366,31 @@ class TwitterOAuthPublisher:
                     self.user_info
                 )
                 
-                logger.info(f"Twitter API v1.1 client connected for user: @{user.screen_name}")
+                logger.info(f"Twitter API v1.1 client connected for user: @{self.user_info['username']}")
                 return True
                 
             except Exception as e:
                 logger.error(f"Failed to verify Twitter credentials: {e}")
-                self.client = None
+                self._swap_bundle(client=None)
                 return False
                 
         except Exception as e:
             logger.error(f"Error creating Twitter client: {e}")
             return False
     
+    def _credentials(self, account: Dict) -> twitter_http.OAuth1Credentials:
+        """Key pairs for signing requests on behalf of a pooled account"""
+        return twitter_http.OAuth1Credentials(
+            self.app_api_key, self.app_api_secret,
+            account['access_token'], account['access_token_secret']
+        )
+    
     def get_authorization_url(self) -> Optional[str]:
-        """Get Twitter authorization URL for OAuth flow"""
+        """Get Twitter authorization URL for OAuth flow
+        
+        Each call starts its own flow, remembered by request token, so
+        concurrent logins don't overwrite each other.
+        """
         try:
             if not self.auth_handler:
                 logger.error("OAuth handler not initialized")
@@ -150,10 +401,14 @@ class TwitterOAuthPublisher:
                 return None
             
             # Get request token and authorization URL
-            auth_url = self.auth_handler.get_authorization_url()
+            handler = self._new_auth_handler()
+            auth_url = handler.get_authorization_url()
             
-            # Save request token for callback
-            self.request_token = self.auth_handler.request_token
+            # Twitter echoes the request token back as oauth_token on the callback
+            self._prune_pending_auth()
+            self._pending_auth[handler.request_token['oauth_token']] = (
+                time.monotonic() + PENDING_AUTH_TTL, handler
+            )
             
             logger.info(f"Generated authorization URL: {auth_url}")
             return auth_url
@@ -162,22 +417,32 @@ class TwitterOAuthPublisher:
             logger.error(f"Error getting authorization URL: {e}")
             return None
     
-    def complete_authorization(self, oauth_verifier: str) -> bool:
-        """Complete OAuth authorization with verifier code"""
+    def complete_authorization(self, oauth_verifier: str, oauth_token: Optional[str] = None) -> bool:
+        """Complete OAuth authorization with verifier code
+        
+        oauth_token is the request token from the callback query; without it
+        the most recently started authorization is completed.
+        """
         try:
-            if not self.auth_handler or not hasattr(self, 'request_token'):
+            self._prune_pending_auth()
+            if oauth_token is None and self._pending_auth:
+                oauth_token = next(reversed(self._pending_auth))
+            pending = self._pending_auth.pop(oauth_token, None)
+            if not self.auth_handler or pending is None:
                 logger.error("Missing auth handler or request token")
                 return False
             
-            # Set the request token
-            self.auth_handler.request_token = self.request_token
+            _, handler = pending
             
             # Get access token
-            access_token, access_token_secret = self.auth_handler.get_access_token(oauth_verifier)
+            access_token, access_token_secret = handler.get_access_token(oauth_verifier)
             
-            # Save tokens
+            # Save tokens; the new authorization replaces the whole pool, so
+            # nothing keeps posting from a previously connected account
             self.user_access_token = access_token
             self.user_access_secret = access_token_secret
+            self._swap_bundle(user_info=None, accounts={}, primary=None)
+            self._user_info_cached_at = None
             
             # Create client and get user info
             success = self._create_client()
@@ -193,77 +458,96 @@ class TwitterOAuthPublisher:
         return self.client is not None and self.user_info is not None
     
     def get_user_info(self) -> Optional[Dict]:
-        """Get connected user information"""
-        if self.user_info:
+        """Get connected user information, re-verified at most every USER_INFO_TTL seconds"""
+        if self._user_info_fresh():
             return self.user_info
         
         # Try to get fresh user info if we have a client
         try:
             if self.client:
-                user = self.client.verify_credentials()
-                self.user_info = {
-                    'username': user.screen_name,
-                    'name': user.name,
-                    'followers': user.followers_count,
-                    'following': user.friends_count,
-                    'profile_image': user.profile_image_url_https,
-                    'user_id': user.id_str
-                }
-                return self.user_info
+                return self._verify_user()
         except Exception as e:
             logger.error(f"Error getting user info: {e}")
         
-        return None
+        # Fall back to the last known details rather than failing
+        return self.user_info
     
     async def publish_tweet(self, content: str) -> Dict:
         """Publish a tweet using API v1.1 (works with FREE tier)"""
         try:
-            if not self.client:
+            # One snapshot of the connection state for the whole publish
+            bundle = self._bundle
+            if not bundle.client:
                 return {
                     "success": False,
                     "error": "Not connected to Twitter. Please login first.",
                     "message": "Twitter login required"
                 }
             
-            # Get user info to build correct URL
-            user_info = self.get_user_info()
-            if not user_info:
+            # The username (and so the tweet URL prefix) is known from connect
+            # time, so posting never has to verify credentials first
+            account = self._pick_account(bundle)
+            if account is None:
                 return {
                     "success": False,
                     "error": "Cannot get user information",
                     "message": "Failed to get Twitter user info"
                 }
             
+            # Reject locally instead of spending a request on a certain 429
+            if not account['bucket'].try_acquire():
+                return {
+                    "success": False,
+                    "error": "Local rate limit reached. Please try again later.",
+                    "message": "Twitter API rate limit reached",
+                    "retry_after": account['bucket'].next_refill()
+                }
+            
             # Post tweet using API v1.1 (FREE TIER COMPATIBLE)
-            logger.info(f"Posting tweet via API v1.1: {content[:50]}...")
-            tweet = self.client.update_status(content)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Posting tweet via API v1.1: %s...", content[:50])
+            # Posted over the shared keep-alive connection pool
+            try:
+                tweet, limit = await twitter_http.update_status(self._credentials(account), content)
+            except httpx.HTTPStatusError as e:
+                self._update_rate_limit(account, twitter_http.rate_limit(e.response))
+                raise
+            self._update_rate_limit(account, limit)
+            tweet_id = tweet['id_str']
             
             # Build correct URL using actual username
-            username = user_info['username']
-            tweet_url = f"https://twitter.com/{username}/status/{tweet.id}"
+            username = account['user_info']['username']
+            tweet_url = account['url_prefix'] + tweet_id
             
-            logger.info(f"Successfully posted tweet: {tweet.id} by @{username}")
+            logger.info("Successfully posted tweet: %s by @%s", tweet_id, username)
             return {
                 "success": True,
-                "tweet_id": str(tweet.id),
+                "tweet_id": tweet_id,
                 "url": tweet_url,
                 "username": username,
                 "message": f"Tweet posted to @{username}",
                 "method": "api_v1.1"
             }
             
-        except tweepy.TooManyRequests:
-            return {
-                "success": False,
-                "error": "Rate limit exceeded. Please try again later.",
-                "message": "Twitter API rate limit reached"
-            }
-        except tweepy.Forbidden as e:
-            logger.error(f"Twitter API Forbidden error: {e}")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 429:
+                return {
+                    "success": False,
+                    "error": "Rate limit exceeded. Please try again later.",
+                    "message": "Twitter API rate limit reached"
+                }
+            if e.response.status_code == 403:
+                logger.error(f"Twitter API Forbidden error: {e}")
+                return {
+                    "success": False,
+                    "error": f"Twitter API error: {str(e)}",
+                    "message": "Permission denied - check your Twitter app permissions"
+                }
+            logger.error(f"Error posting tweet: {e}")
             return {
                 "success": False,
-                "error": f"Twitter API error: {str(e)}",
-                "message": "Permission denied - check your Twitter app permissions"
+                "error": str(e),
+                "message": "Failed to post tweet"
             }
         except Exception as e:
             logger.error(f"Error posting tweet: {e}")
@@ -278,12 +562,15 @@ class TwitterOAuthPublisher:
         try:
             self.user_access_token = None
             self.user_access_secret = None
-            self.user_info = None
-            self.client = None
+            self._swap_bundle(client=None, user_info=None, accounts={}, primary=None)
+            self._user_info_cached_at = None
             
             # Remove saved tokens
-            if os.path.exists('data/twitter_user_tokens.json'):
-                os.remove('data/twitter_user_tokens.json')
+            try:
+                os.unlink(TOKEN_FILE)
+            except FileNotFoundError:
+                pass
+            self._last_token_blob = None
                 
             logger.info("Disconnected from Twitter")
             return True
@@ -324,5 +611,18 @@ class TwitterOAuthPublisher:
             "note": "Uses Twitter's API v1.1 via OAuth - compatible with Essential (free) access tier"
         }
 
-# Initialize OAuth publisher
-twitter_oauth_publisher = TwitterOAuthPublisher()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_twitter_oauth_publisher() -> TwitterOAuthPublisher:
+    """Shared OAuth publisher, created on first use
+    
+    Construction reads the token file and may verify credentials with
+    Twitter, so it is deferred until something actually needs it.
+    """
+    return TwitterOAuthPublisher()
+
+def __getattr__(name):
+    # Keep `from ... import twitter_oauth_publisher` working without
+    # constructing the publisher at import time
+    if name == "twitter_oauth_publisher":
+        return get_twitter_oauth_publisher()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -3,54 +3,72 @@ Real Twitter API Integration for Freyja
 FIXED VERSION - No more "yourhandle" placeholders
 """
 
+import asyncio
 import tweepy
 import os
 import logging
-from typing import Optional, Dict
+from functools import lru_cache
+from typing import Optional, Dict, List
+
+from publishing import twitter_http
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=1)
+def _env_credentials() -> tuple:
+    """(api_key, api_secret, access_token, access_token_secret, bearer_token)
+    
+    Read once, on first construction rather than at import, so a .env
+    loaded after this module is imported is still picked up.
+    """
+    return (
+        os.getenv('TWITTER_API_KEY'),
+        os.getenv('TWITTER_API_SECRET'),
+        os.getenv('TWITTER_ACCESS_TOKEN'),
+        os.getenv('TWITTER_ACCESS_TOKEN_SECRET'),
+        os.getenv('TWITTER_BEARER_TOKEN')
+    )
+
 class TwitterPublisher:
     """Real Twitter API integration using Tweepy with proper username handling"""
     
     def __init__(self):
-        self.api_key = os.getenv('TWITTER_API_KEY')
-        self.api_secret = os.getenv('TWITTER_API_SECRET')
-        self.access_token = os.getenv('TWITTER_ACCESS_TOKEN')
-        self.access_token_secret = os.getenv('TWITTER_ACCESS_TOKEN_SECRET')
-        self.bearer_token = os.getenv('TWITTER_BEARER_TOKEN')
+        (self.api_key, self.api_secret, self.access_token,
+         self.access_token_secret, self.bearer_token) = _env_credentials()
         
         self.client = None
         self.user_info = None
+        self._user_info_checked = False
         self._initialize_client()
     
     def _initialize_client(self):
         """Initialize Twitter API client"""
+        if not all([self.api_key, self.api_secret, self.access_token, self.access_token_secret]):
+            logger.warning("Twitter API credentials not found - using simulation mode")
+            return
+        
         try:
-            if all([self.api_key, self.api_secret, self.access_token, self.access_token_secret]):
-                self.client = tweepy.Client(
-                    bearer_token=self.bearer_token,
-                    consumer_key=self.api_key,
-                    consumer_secret=self.api_secret,
-                    access_token=self.access_token,
-                    access_token_secret=self.access_token_secret,
-                    wait_on_rate_limit=True
-                )
-                
-                # Get user info for URL generation
-                self._fetch_user_info()
-                logger.info("Twitter API client initialized successfully")
-            else:
-                logger.warning("Twitter API credentials not found - using simulation mode")
+            self.client = tweepy.Client(
+                bearer_token=self.bearer_token,
+                consumer_key=self.api_key,
+                consumer_secret=self.api_secret,
+                access_token=self.access_token,
+                access_token_secret=self.access_token_secret,
+                wait_on_rate_limit=True
+            )
+            self.client.session = twitter_http.get_requests_session()
+            # User info is fetched by ensure_ready(), not here, so constructing
+            # the publisher does no network I/O
+            logger.info("Twitter API client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Twitter client: {e}")
     
-    def _fetch_user_info(self):
+    async def _fetch_user_info_async(self):
         """Fetch user information for proper URL generation"""
         try:
             if self.client:
-                # Get authenticated user info
-                me = self.client.get_me()
+                # Get authenticated user info (blocking tweepy call, run off the loop)
+                me = await asyncio.to_thread(self.client.get_me)
                 if me.data:
                     self.user_info = {
                         'username': me.data.username,
@@ -61,19 +79,34 @@ class TwitterPublisher:
         except Exception as e:
             logger.error(f"Error fetching user info: {e}")
     
+    async def ensure_ready(self):
+        """Fetch the account's user info once, before the first publish"""
+        if self.client and not self._user_info_checked:
+            self._user_info_checked = True
+            await self._fetch_user_info_async()
+    
+    def _credentials(self) -> twitter_http.OAuth1Credentials:
+        """Key pairs for signing requests as the configured account"""
+        return twitter_http.OAuth1Credentials(
+            self.api_key, self.api_secret,
+            self.access_token, self.access_token_secret
+        )
+    
     async def publish_tweet(self, content: str) -> dict:
         """Publish a tweet to Twitter with correct URL generation"""
         try:
+            await self.ensure_ready()
+            
             if self.client and self.user_info:
                 # Post tweet using API v2
-                response = self.client.create_tweet(text=content)
-                tweet_id = response.data['id']
+                response = await twitter_http.create_tweet(self._credentials(), content)
+                tweet_id = response['data']['id']
                 
                 # Generate correct URL using actual username
                 username = self.user_info['username']
                 tweet_url = f"https://twitter.com/{username}/status/{tweet_id}"
                 
-                logger.info(f"Successfully posted tweet: {tweet_id} by @{username}")
+                logger.info("Successfully posted tweet: %s by @%s", tweet_id, username)
                 return {
                     "success": True,
                     "tweet_id": tweet_id,
@@ -84,14 +117,14 @@ class TwitterPublisher:
             
             elif self.client:
                 # Client exists but no user info - try to post anyway
-                response = self.client.create_tweet(text=content)
-                tweet_id = response.data['id']
+                response = await twitter_http.create_tweet(self._credentials(), content)
+                tweet_id = response['data']['id']
                 
                 # Try to get username from the response or use placeholder
                 username = "twitter_user"  # Better fallback than "yourhandle"
                 tweet_url = f"https://twitter.com/{username}/status/{tweet_id}"
                 
-                logger.info(f"Posted tweet {tweet_id} (username unknown)")
+                logger.info("Posted tweet %s (username unknown)", tweet_id)
                 return {
                     "success": True,
                     "tweet_id": tweet_id,
@@ -125,6 +158,22 @@ class TwitterPublisher:
                 "message": "Failed to post tweet"
             }
     
+    async def publish_tweets(self, contents: List[str], max_concurrency: int = 4) -> List[dict]:
+        """Publish several tweets concurrently, at most max_concurrency in flight
+        
+        Results are returned in the order of contents.
+        """
+        # Resolve user info once up front rather than racing it per tweet
+        await self.ensure_ready()
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def publish_one(content: str) -> dict:
+            async with semaphore:
+                return await self.publish_tweet(content)
+        
+        return await asyncio.gather(*(publish_one(content) for content in contents))
+    
     def get_setup_instructions(self) -> dict:
         """Get instructions for setting up Twitter API"""
         connected = self.client is not None
@@ -151,5 +200,18 @@ class TwitterPublisher:
             "current_user": f"@{username}" if username else "No user info"
         }
 
-# Initialize the Twitter publisher
-twitter_publisher = TwitterPublisher()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_twitter_publisher() -> TwitterPublisher:
+    """Shared Twitter publisher, created on first use
+    
+    Construction reads credentials and builds the tweepy client, so it is
+    deferred until something actually publishes.
+    """
+    return TwitterPublisher()
+
+def __getattr__(name):
+    # Keep `from ... import twitter_publisher` working without constructing
+    # the publisher at import time
+    if name == "twitter_publisher":
+        return get_twitter_publisher()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -5,21 +5,27 @@ No paid APIs required - uses free sources and scraping
 
 import asyncio
 import aiohttp
-import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from selectolax.parser import HTMLParser
+from typing import List, Dict, NamedTuple, Optional
 from datetime import datetime, timedelta
-import json
+from functools import lru_cache, wraps
+from pathlib import Path
+import hashlib
 import logging
-from dataclasses import dataclass
+import orjson
 import random
+import re
 import time
 
+from config import get_settings
+
 logger = logging.getLogger(__name__)
 
-@dataclass
-class FreeTrendData:
-    """Free trend data structure"""
+# Source results are kept here between runs, one file per source and arguments
+CACHE_DIR = Path("data/cache/trends")
+
+class FreeTrendData(NamedTuple):
+    """Free trend data structure (immutable; use _replace to adjust)"""
     keyword: str
     score: float
     source: str
@@ -27,15 +33,145 @@ class FreeTrendData:
     category: Optional[str] = None
     url: Optional[str] = None
 
+def ttl_cached(ttl: float):
+    """Reuse a source method's non-empty results for `ttl` seconds
+    
+    Results are kept in memory and under CACHE_DIR, so a restart within the
+    TTL doesn't hit the network either. Trends are immutable, so callers
+    can't disturb cached entries; a new list is returned each time.
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            key = hashlib.sha256(
+                repr((func.__name__, args, sorted(kwargs.items()))).encode()
+            ).hexdigest()[:16]
+            trends = self._read_cached(key, ttl)
+            if trends is None:
+                trends = await func(self, *args, **kwargs)
+                if trends:
+                    self._write_cached(key, trends)
+            return list(trends)
+        return wrapper
+    return decorator
+
 class FreeResearchTools:
     """Free research tools using public APIs and scraping"""
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        # One pooled session for every source, created on first request
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Compiled relevance pattern and the keywords it was built from
+        self._matcher_key: Optional[tuple] = None
+        self._matcher: Optional[re.Pattern] = None
+        # Lowercased preferred topics and the setting they were parsed from
+        self._preferred_raw: Optional[str] = None
+        self._preferred_lower: tuple = ()
+        # Source results by cache key: (stored_at, trends)
+        self._cache: Dict[str, tuple] = {}
+        # Validators and parsed body per URL: (etag, last_modified, data)
+        self._conditional: Dict[str, tuple] = {}
+    
+    def _read_cached(self, key: str, ttl: float) -> Optional[List[FreeTrendData]]:
+        """Return cached trends for a key if they have not expired"""
+        now = time.time()
+        hit = self._cache.get(key)
+        if hit and now - hit[0] < ttl:
+            return hit[1]
+        
+        path = CACHE_DIR / f"{key}.json"
+        try:
+            stored_at = path.stat().st_mtime
+            if now - stored_at >= ttl:
+                return None
+            trends = [
+                FreeTrendData(**{**item, 'timestamp': datetime.fromisoformat(item['timestamp'])})
+                for item in orjson.loads(path.read_bytes())
+            ]
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+        
+        self._cache[key] = (stored_at, trends)
+        return trends
+    
+    def _write_cached(self, key: str, trends: List[FreeTrendData]):
+        """Keep trends in memory and on disk for later runs"""
+        self._cache[key] = (time.time(), trends)
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            (CACHE_DIR / f"{key}.json").write_bytes(orjson.dumps([trend._asdict() for trend in trends]))
+        except OSError as e:
+            logger.warning(f"Could not write trend cache: {e}")
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Shared keep-alive session, so repeat requests skip TCP/TLS setup"""
+        loop = asyncio.get_running_loop()
+        # A session is bound to the loop that created it and can only be
+        # closed there, so it must be closed before another loop uses the
+        # instance (close_free_research_tools() at the end of each run)
+        if self._session is not None and not self._session.closed and self._session_loop is not loop:
+            raise RuntimeError(
+                "FreeResearchTools session belongs to another event loop; "
+                "close() it on that loop before reusing the instance"
+            )
+        if self._session is None or self._session.closed:
+            self._session_loop = loop
+            self._session = aiohttp.ClientSession(
+                headers={
+                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+                },
+                timeout=aiohttp.ClientTimeout(total=15),
+                connector=aiohttp.TCPConnector(
+                    limit=50, limit_per_host=10, ttl_dns_cache=300, keepalive_timeout=60
+                )
+            )
+        return self._session
+    
+    async def close(self):
+        """Close the shared session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+    
+    async def __aenter__(self):
+        await self._get_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def _get_json(self, url: str):
+        """GET a JSON endpoint, revalidating an earlier copy with ETag/Last-Modified
+        
+        A 304 carries no body, so the stored parse is reused and neither the
+        transfer nor orjson.loads is repeated. Returns None on other errors.
+        """
+        session = await self._get_session()
+        cached = self._conditional.get(url)
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and cached:
+                return cached[2]
+            if response.status != 200:
+                return None
+            data = orjson.loads(await response.read())
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+        
+        if etag or last_modified:
+            self._conditional[url] = (etag, last_modified, data)
+        return data
     
+    @ttl_cached(300)
     async def get_reddit_trends(self, subreddits: List[str] = None) -> List[FreeTrendData]:
         """Get trending topics from Reddit (free JSON API)"""
         if not subreddits:
@@ -48,10 +184,9 @@ class FreeResearchTools:
                 # Reddit's JSON API is free
                 url = f"https://www.reddit.com/r/{subreddit}/hot.json?limit=10"
                 
-                response = self.session.get(url)
-                if response.status_code == 200:
-                    data = response.json()
-                    
+                data = await self._get_json(url)
+                
+                if data:
                     for post in data['data']['children']:
                         post_data = post['data']
                         
@@ -66,13 +201,14 @@ class FreeResearchTools:
                         trends.append(trend)
                 
                 # Be respectful to Reddit's servers
-                time.sleep(1)
+                await asyncio.sleep(1)
                 
             except Exception as e:
                 logger.error(f"Error fetching Reddit trends from r/{subreddit}: {e}")
         
         return trends
     
+    @ttl_cached(1800)
     async def get_github_trending(self, language: str = "python") -> List[FreeTrendData]:
         """Get trending repositories from GitHub"""
         trends = []
@@ -80,10 +216,9 @@ class FreeResearchTools:
         try:
             url = f"https://api.github.com/search/repositories?q=language:{language}&sort=stars&order=desc&per_page=10"
             
-            response = self.session.get(url)
-            if response.status_code == 200:
-                data = response.json()
-                
+            data = await self._get_json(url)
+            
+            if data:
                 for repo in data['items']:
                     trend = FreeTrendData(
                         keyword=repo['name'],
@@ -100,6 +235,14 @@ class FreeResearchTools:
         
         return trends
     
+    async def _fetch_hn_item(self, semaphore: asyncio.Semaphore,
+                             session: aiohttp.ClientSession, story_id: int) -> Optional[Dict]:
+        """Fetch one Hacker News item, holding a slot of the shared semaphore"""
+        story_url = f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json"
+        async with semaphore, session.get(story_url) as story_response:
+            return orjson.loads(await story_response.read()) if story_response.status == 200 else None
+    
+    @ttl_cached(120)
     async def get_hackernews_trends(self) -> List[FreeTrendData]:
         """Get trending stories from Hacker News"""
         trends = []
@@ -107,30 +250,36 @@ class FreeResearchTools:
         try:
             # Get top stories IDs
             top_stories_url = "https://hacker-news.firebaseio.com/v0/topstories.json"
-            response = self.session.get(top_stories_url)
+            session = await self._get_session()
+            async with session.get(top_stories_url) as response:
+                story_ids = orjson.loads(await response.read()) if response.status == 200 else None
             
-            if response.status_code == 200:
-                story_ids = response.json()[:10]  # Top 10 stories
+            if story_ids:
+                story_ids = story_ids[:10]  # Top 10 stories
                 
-                for story_id in story_ids:
-                    story_url = f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json"
-                    story_response = self.session.get(story_url)
-                    
-                    if story_response.status_code == 200:
-                        story = story_response.json()
-                        
-                        if story and 'title' in story:
-                            trend = FreeTrendData(
-                                keyword=story['title'][:50],
-                                score=float(story.get('score', 0)),
-                                source="hackernews",
-                                timestamp=datetime.now(),
-                                category='tech_news',
-                                url=story.get('url', f"https://news.ycombinator.com/item?id={story_id}")
-                            )
-                            trends.append(trend)
+                # Items are independent, so fetch them concurrently (at most
+                # 8 in flight, to stay polite to the API)
+                semaphore = asyncio.Semaphore(8)
+                stories = await asyncio.gather(
+                    *(self._fetch_hn_item(semaphore, session, story_id) for story_id in story_ids),
+                    return_exceptions=True
+                )
+                
+                for story_id, story in zip(story_ids, stories):
+                    if isinstance(story, Exception):
+                        logger.error(f"Error fetching Hacker News item {story_id}: {story}")
+                        continue
                     
-                    time.sleep(0.1)  # Rate limiting
+                    if story and 'title' in story:
+                        trend = FreeTrendData(
+                            keyword=story['title'][:50],
+                            score=float(story.get('score', 0)),
+                            source="hackernews",
+                            timestamp=datetime.now(),
+                            category='tech_news',
+                            url=story.get('url', f"https://news.ycombinator.com/item?id={story_id}")
+                        )
+                        trends.append(trend)
             
         except Exception as e:
             logger.error(f"Error fetching Hacker News trends: {e}")
@@ -144,18 +293,22 @@ class FreeResearchTools:
         try:
             # Product Hunt doesn't require API key for basic data
             url = "https://www.producthunt.com/"
-            response = self.session.get(url)
+            session = await self._get_session()
+            async with session.get(url) as response:
+                content = await response.read() if response.status == 200 else None
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+            if content:
+                # lexbor-backed parser; much faster than bs4 + html.parser on large pages
+                tree = HTMLParser(content)
                 
                 # Find product names (this is simplified - real implementation would need more robust scraping)
-                products = soup.find_all('h3', limit=10)
+                products = tree.css('h3')[:10]
                 
                 for i, product in enumerate(products):
-                    if product.text.strip():
+                    name = product.text(strip=True)
+                    if name:
                         trend = FreeTrendData(
-                            keyword=product.text.strip()[:30],
+                            keyword=name[:30],
                             score=float(100 - i),  # Simple scoring
                             source="producthunt",
                             timestamp=datetime.now(),
@@ -168,6 +321,7 @@ class FreeResearchTools:
         
         return trends
     
+    @ttl_cached(3600)
     async def get_google_trends_free(self) -> List[FreeTrendData]:
         """Get Google trends using pytrends (free)"""
         trends = []
@@ -218,37 +372,64 @@ class FreeResearchTools:
             except Exception as e:
                 print(f"⚠️  Failed to get trends from source: {e}")
         
+        # Sources overlap, so keep only the best-scoring trend per keyword
+        # before sorting
+        best: Dict[str, FreeTrendData] = {}
+        for trend in all_trends:
+            key = trend.keyword.lower()
+            current = best.get(key)
+            if current is None or trend.score > current.score:
+                best[key] = trend
+        
         # Sort by score
-        all_trends.sort(key=lambda x: x.score, reverse=True)
+        return sorted(best.values(), key=lambda x: x.score, reverse=True)
+    
+    def _preferred_keywords(self) -> tuple:
+        """Lowercased brand topics, re-parsed only when the setting changes"""
+        brand = get_settings().brand
+        if brand.preferred_topics != self._preferred_raw:
+            self._preferred_raw = brand.preferred_topics
+            self._preferred_lower = tuple(
+                topic.lower() for topic in brand.get_preferred_topics_list() if topic
+            )
+        return self._preferred_lower
+    
+    def _relevance_matcher(self, keywords: tuple) -> Optional[re.Pattern]:
+        """Single alternation pattern matching any lowercased keyword as a substring
         
-        return all_trends
+        One regex scan per trend replaces a substring test per keyword. The
+        pattern is rebuilt only when the keyword tuple changes.
+        """
+        if keywords != self._matcher_key:
+            self._matcher_key = keywords
+            self._matcher = re.compile('|'.join(map(re.escape, keywords))) if keywords else None
+        return self._matcher
     
     def filter_trends_by_relevance(self, trends: List[FreeTrendData], 
                                  relevant_keywords: List[str] = None) -> List[FreeTrendData]:
         """Filter trends by relevance to your brand"""
-        if not relevant_keywords:
-            from config import get_settings
-            settings = get_settings()
-            relevant_keywords = settings.brand.preferred_topics
+        if relevant_keywords:
+            keywords = tuple(keyword.lower() for keyword in relevant_keywords if keyword)
+        else:
+            keywords = self._preferred_keywords()
         
-        filtered_trends = []
+        matcher = self._relevance_matcher(keywords)
+        relevant = []
+        others = []
         
         for trend in trends:
-            keyword_lower = trend.keyword.lower()
-            
             # Check if trend matches any relevant keywords
-            is_relevant = any(
-                keyword.lower() in keyword_lower 
-                for keyword in relevant_keywords
-            )
-            
-            if is_relevant:
-                trend.score += 50  # Boost relevant trends
-                filtered_trends.append(trend)
-            elif random.random() < 0.3:  # Include 30% of other trends for diversity
-                filtered_trends.append(trend)
+            if matcher is not None and matcher.search(trend.keyword.lower()) is not None:
+                relevant.append(trend._replace(score=trend.score + 50))  # Boost relevant trends
+            else:
+                others.append(trend)
         
-        return filtered_trends
+        # Include ~30% of other trends for diversity: draw how many, then which,
+        # instead of one random() call per trend (order is kept)
+        count = random.binomialvariate(len(others), 0.3)
+        sampled = [others[i] for i in sorted(random.sample(range(len(others)), count))]
+        
+        return relevant + sampled
     
     def save_trends(self, trends: List[FreeTrendData], filename: str = None):
         """Save trends to JSON file"""
@@ -256,34 +437,35 @@ class FreeResearchTools:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"free_trends_{timestamp}.json"
         
-        from pathlib import Path
         filepath = Path("data/raw") / filename
         filepath.parent.mkdir(parents=True, exist_ok=True)
         
-        trends_data = []
-        for trend in trends:
-            trends_data.append({
-                'keyword': trend.keyword,
-                'score': trend.score,
-                'source': trend.source,
-                'timestamp': trend.timestamp.isoformat(),
-                'category': trend.category,
-                'url': trend.url
-            })
-        
-        with open(filepath, 'w') as f:
-            json.dump(trends_data, f, indent=2)
+        # Tuples would serialize as arrays, so write each trend as an object
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps([trend._asdict() for trend in trends], option=orjson.OPT_INDENT_2))
         
         print(f"💾 Saved {len(trends)} trends to {filepath}")
 
+@lru_cache(maxsize=1)
+def get_free_research_tools() -> FreeResearchTools:
+    """Process-wide research tools, so every run reuses one pooled session"""
+    return FreeResearchTools()
+
+async def close_free_research_tools():
+    """Close the shared session; call it on the loop that used it, before that loop ends
+    
+    Cached results are kept, so a later asyncio.run() reuses them with a new session.
+    """
+    if get_free_research_tools.cache_info().currsize:
+        await get_free_research_tools().close()
+
 # Utility functions
 async def monitor_free_trends():
     """Main function to monitor trends using free sources"""
-    research = FreeResearchTools()
-    
     print("🚀 Starting Free Trend Monitoring...")
     
-    # Get all trends
+    # Get all trends (the shared session stays open for the next run)
+    research = get_free_research_tools()
     trends = await research.get_all_free_trends()
     
     # Filter by relevance
@@ -308,19 +490,18 @@ async def test_free_research():
     try:
         print("🧪 Testing Free Research Tools...")
         
-        research = FreeResearchTools()
-        
-        # Test Reddit trends
-        reddit_trends = await research.get_reddit_trends(['technology'])
-        print(f"✅ Reddit trends: {len(reddit_trends)}")
-        
-        # Test GitHub trends  
-        github_trends = await research.get_github_trending()
-        print(f"✅ GitHub trends: {len(github_trends)}")
-        
-        # Test Hacker News
-        hn_trends = await research.get_hackernews_trends()
-        print(f"✅ Hacker News trends: {len(hn_trends)}")
+        async with FreeResearchTools() as research:
+            # Test Reddit trends
+            reddit_trends = await research.get_reddit_trends(['technology'])
+            print(f"✅ Reddit trends: {len(reddit_trends)}")
+            
+            # Test GitHub trends  
+            github_trends = await research.get_github_trending()
+            print(f"✅ GitHub trends: {len(github_trends)}")
+            
+            # Test Hacker News
+            hn_trends = await research.get_hackernews_trends()
+            print(f"✅ Hacker News trends: {len(hn_trends)}")
         
         return True
         
@@ -328,5 +509,11 @@ async def test_free_research():
         print(f"❌ Free research test failed: {e}")
         return False
 
+async def _run_once():
+    try:
+        await monitor_free_trends()
+    finally:
+        await close_free_research_tools()
+
 if __name__ == "__main__":
-    asyncio.run(monitor_free_trends())
\ No newline at end of file
+    asyncio.run(_run_once())
\ No newline at end of file
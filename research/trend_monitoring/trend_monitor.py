@@ -6,17 +6,21 @@ Monitors trending topics, hashtags, and conversations for content inspiration
 from pytrends.request import TrendReq
 import requests
 from bs4 import BeautifulSoup
-import json
+import orjson
 import asyncio
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import logging
+import re
 from dataclasses import dataclass
 from config import get_settings
 
 settings = get_settings()
 
-@dataclass
+# First whitespace-delimited, purely alphabetic word of 5+ letters in a title
+_WORD_RE = re.compile(r'(?<!\S)[^\W\d_]{5,}(?!\S)')
+
+@dataclass(slots=True)
 class TrendData:
     """Data structure for trend information"""
     keyword: str
@@ -32,6 +36,13 @@ class TrendMonitor:
     def __init__(self):
         self.pytrends = TrendReq(hl='en-US', tz=360)
         self.logger = logging.getLogger(__name__)
+        # Brand topics lowercased once rather than per trend
+        self._avoid_lower = tuple(
+            topic.lower() for topic in settings.brand.get_avoid_topics_list() if topic
+        )
+        self._pref_lower = tuple(
+            topic.lower() for topic in settings.brand.get_preferred_topics_list() if topic
+        )
         
     async def get_google_trends(self, timeframe: str = 'today 1-d') -> List[TrendData]:
         """
@@ -45,7 +56,7 @@ class TrendMonitor:
         """
         try:
             # Get trending searches
-            trending_searches = self.pytrends.trending_searches(pn='united_states')
+            trending_searches = await asyncio.to_thread(self.pytrends.trending_searches, pn='united_states')
             
             trends = []
             for i, keyword in enumerate(trending_searches[0][:settings.research.max_trends_per_check]):
@@ -65,6 +76,11 @@ class TrendMonitor:
             self.logger.error(f"Error fetching Google Trends: {e}")
             return []
     
+    def _interest_over_time(self, keywords: List[str]):
+        """Blocking pytrends query for up to 5 keywords compared together"""
+        self.pytrends.build_payload(keywords, timeframe='today 1-d', geo='US')
+        return self.pytrends.interest_over_time()
+    
     async def get_tech_trends(self) -> List[TrendData]:
         """Get technology-specific trending topics"""
         try:
@@ -77,22 +93,25 @@ class TrendMonitor:
             
             trends = []
             
-            for keyword in tech_keywords:
-                self.pytrends.build_payload([keyword], timeframe='today 1-d', geo='US')
-                interest_over_time = self.pytrends.interest_over_time()
+            # pytrends compares up to 5 keywords per payload, so 10 keywords
+            # take 2 requests (and 2 rate-limit pauses) instead of 10
+            for start in range(0, len(tech_keywords), 5):
+                group = tech_keywords[start:start + 5]
+                interest_over_time = await asyncio.to_thread(self._interest_over_time, group)
                 
                 if not interest_over_time.empty:
-                    # Get latest score
-                    latest_score = interest_over_time[keyword].iloc[-1]
-                    
-                    trend = TrendData(
-                        keyword=keyword,
-                        score=float(latest_score),
-                        source='google_trends_tech',
-                        timestamp=datetime.now(),
-                        category='technology'
-                    )
-                    trends.append(trend)
+                    for keyword in group:
+                        # Get latest score
+                        latest_score = interest_over_time[keyword].iloc[-1]
+                        
+                        trend = TrendData(
+                            keyword=keyword,
+                            score=float(latest_score),
+                            source='google_trends_tech',
+                            timestamp=datetime.now(),
+                            category='technology'
+                        )
+                        trends.append(trend)
                     
                 # Add delay to respect rate limits
                 await asyncio.sleep(1)
@@ -155,24 +174,22 @@ class TrendMonitor:
                 'pageSize': 20
             }
             
-            response = requests.get(url, params=params)
+            response = await asyncio.to_thread(requests.get, url, params=params, timeout=15)
             if response.status_code == 200:
                 news_data = response.json()
                 
                 for i, article in enumerate(news_data.get('articles', [])):
-                    # Extract keywords from title
-                    title_words = article['title'].split()
-                    for word in title_words:
-                        if len(word) > 4 and word.isalpha():  # Filter meaningful words
-                            trend = TrendData(
-                                keyword=word.lower(),
-                                score=float(100 - i),
-                                source='news_api',
-                                timestamp=datetime.now(),
-                                category='news'
-                            )
-                            trends.append(trend)
-                            break  # One keyword per article for simplicity
+                    # Extract one meaningful keyword per article title
+                    match = _WORD_RE.search(article['title'])
+                    if match:
+                        trend = TrendData(
+                            keyword=match.group(0).lower(),
+                            score=float(100 - i),
+                            source='news_api',
+                            timestamp=datetime.now(),
+                            category='news'
+                        )
+                        trends.append(trend)
             
             self.logger.info(f"Retrieved {len(trends)} news trends")
             return trends
@@ -216,11 +233,11 @@ class TrendMonitor:
             keyword_lower = trend.keyword.lower()
             
             # Skip if in avoid topics
-            if any(avoid.lower() in keyword_lower for avoid in settings.brand.avoid_topics):
+            if any(avoid in keyword_lower for avoid in self._avoid_lower):
                 continue
             
             # Prioritize if in preferred topics
-            if any(pref.lower() in keyword_lower for pref in settings.brand.preferred_topics):
+            if any(pref in keyword_lower for pref in self._pref_lower):
                 trend.score += 20  # Boost score for preferred topics
             
             filtered_trends.append(trend)
@@ -236,20 +253,9 @@ class TrendMonitor:
         filepath = settings.data_dir / "raw" / filename
         filepath.parent.mkdir(parents=True, exist_ok=True)
         
-        trends_dict = []
-        for trend in trends:
-            trend_dict = {
-                'keyword': trend.keyword,
-                'score': trend.score,
-                'source': trend.source,
-                'timestamp': trend.timestamp.isoformat(),
-                'category': trend.category,
-                'related_topics': trend.related_topics
-            }
-            trends_dict.append(trend_dict)
-        
-        with open(filepath, 'w') as f:
-            json.dump(trends_dict, f, indent=2)
+        # orjson serializes the dataclasses (and their datetimes) directly
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(trends, option=orjson.OPT_INDENT_2))
         
         self.logger.info(f"Saved {len(trends)} trends to {filepath}")
 
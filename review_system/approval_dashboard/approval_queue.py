@@ -3,19 +3,113 @@ Freyja - Approval Queue System
 FIXED VERSION - Added missing methods and proper status handling
 """
 
+import asyncio
 import logging
 import uuid
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-import json
+import orjson
 import sqlite3
 import aiosqlite
 import os
+import threading
+import time
+from collections import OrderedDict
+from itertools import groupby
 
 logger = logging.getLogger(__name__)
 
+# Applied once when the shared connection opens: WAL lets readers run
+# alongside a writer, and NORMAL sync is safe under WAL
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA busy_timeout=5000",
+    # Serve reads straight from the OS page cache instead of read() + copy
+    "PRAGMA mmap_size=268435456",
+)
+
+# Takes effect only when the file is created. Re-paging an existing database
+# is a one-off: PRAGMA journal_mode=DELETE; PRAGMA page_size=8192; VACUUM;
+# then reopen (WAL is restored by CONNECTION_PRAGMAS)
+PAGE_SIZE_PRAGMA = "PRAGMA page_size=8192"
+
+# How long writes wait for company before being committed together
+WRITE_BATCH_WINDOW = 0.005
+
+# Local time in the ISO format datetime.isoformat() writes (millisecond
+# precision), so rows stamped by SQLite sort and parse like older rows
+SQL_NOW = "strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')"
+
+# Serialized items kept for the JSON list endpoints
+JSON_CACHE_SIZE = 1024
+
+# Characters of content included in list summaries
+SUMMARY_PREVIEW_CHARS = 160
+
+# Columns of the in-memory pending mirror, in summary query order
+PENDING_MIRROR_COLUMNS = ("id", "content_type", "created_at", "updated_at", "preview")
+
+# sqlite3 reuses a compiled statement when it sees the same SQL text again,
+# so the hot statements live here as constants and the cache is sized to
+# hold all of them
+STATEMENT_CACHE_SIZE = 256
+
+SQL_INSERT_ITEM = f"""
+    INSERT INTO content_items (id, content, content_type, status, source, created_at, updated_at, metadata, edit_history,
+                               overall_quality, source_category)
+    VALUES (?, ?, ?, ?, ?, {SQL_NOW}, {SQL_NOW}, ?, ?, ?, ?)
+"""
+
+# SQLite's default SQLITE_MAX_VARIABLE_NUMBER on older builds; bulk
+# updates split their id lists to stay under it
+MAX_SQL_VARIABLES = 999
+
+# {ids} is filled with one placeholder per id
+SQL_APPROVE_ITEMS = """
+    UPDATE content_items SET status = 'approved', approval_feedback = ?
+    WHERE id IN ({ids})
+"""
+
+SQL_REJECT_ITEMS = """
+    UPDATE content_items SET status = 'rejected', rejection_reason = ?
+    WHERE id IN ({ids})
+"""
+
+SQL_EDIT_ITEM = f"""
+    UPDATE content_items SET
+        content = ?,
+        status = 'edited',
+        edit_history = json_insert(
+            coalesce(edit_history, '[]'), '$[#]',
+            json_object('at', {SQL_NOW}, 'notes', ?, 'previous_content', content)
+        )
+    WHERE id = ?
+"""
+
+SQL_SELECT_ITEM = "SELECT * FROM content_items WHERE id = ?"
+
+SQL_SELECT_BY_STATUS = """
+    SELECT * FROM content_items
+    WHERE status = ?
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+
+SQL_SELECT_COUNT = "SELECT n FROM content_status_counts WHERE status = ?"
+
+SQL_SELECT_SUMMARIES_BY_STATUS = """
+    SELECT id, content_type, status, created_at, updated_at, substr(content, 1, ?)
+    FROM content_items
+    WHERE status = ?
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+
 class ContentStatus(Enum):
     PENDING = "pending"
     APPROVED = "approved"
@@ -24,7 +118,7 @@ class ContentStatus(Enum):
     SCHEDULED = "scheduled"
     PUBLISHED = "published"
 
-@dataclass
+@dataclass(slots=True)
 class ContentItem:
     id: str
     content: str
@@ -42,26 +136,168 @@ class ContentItem:
     
     def dict(self):
         """Convert to dictionary for JSON serialization"""
-        data = asdict(self)
-        if isinstance(data['created_at'], datetime):
-            data['created_at'] = data['created_at'].isoformat()
-        if isinstance(data['updated_at'], datetime):
-            data['updated_at'] = data['updated_at'].isoformat()
-        if isinstance(data['status'], ContentStatus):
-            data['status'] = data['status'].value
-        return data
+        # orjson encodes dataclasses, datetimes (ISO format) and enums (their
+        # value) natively, so one C round trip replaces asdict + conversions
+        return orjson.loads(orjson.dumps(self))
 
 class ApprovalQueue:
     """Manages the content approval queue"""
     
-    def __init__(self, db_path: str = "data/approval_queue.db"):
+    # Database files whose schema has been ensured by this process, so
+    # per-request instances skip the synchronous open and DDL
+    _initialized: set = set()
+    _initialized_lock = threading.Lock()
+    
+    def __init__(self, db_path: str = "data/approval_queue.db", analytics_ttl: float = 1.0,
+                 pending_mirror: bool = True):
+        """analytics_ttl: seconds get_analytics may serve a cached result. Writes
+        made through this instance invalidate it; pass 0 when several processes
+        write to the same database.
+        
+        pending_mirror: serve get_pending_summaries from memory, kept current by
+        this instance's writer and reloaded when another connection (the
+        dashboard's FixedApprovalQueue, another process) has written.
+        """
         self.db_path = db_path
-        self.ensure_tables()
+        self._db: Optional[aiosqlite.Connection] = None
+        self._db_lock = asyncio.Lock()
+        self._analytics_ttl = analytics_ttl
+        self._analytics_cache: Optional[tuple] = None  # (monotonic time, analytics)
+        # Writes waiting for the writer task: (sql, rows, future, on_commit)
+        self._pending_writes: List[Tuple[str, List[tuple], asyncio.Future, Optional[Callable[[], Awaitable]]]] = []
+        self._writer_task: Optional[asyncio.Task] = None
+        self._write_generation = 0  # committed batches, to detect a write racing a mirror load
+        # Pending items as parallel columns, oldest first (None until loaded)
+        self._use_pending_mirror = pending_mirror
+        self._pending_mirror: Optional[Dict[str, list]] = None
+        self._mirror_data_version: Optional[int] = None
+        # Encoded item JSON by (id, updated_at). updated_at only has
+        # millisecond precision, so two writes can share a key: the cache is
+        # cleared on every commit by the writer and whenever another
+        # connection has written (data_version moved)
+        self._json_cache: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+        self._json_cache_data_version: Optional[int] = None
+        
+        db_key = os.path.abspath(db_path)
+        with ApprovalQueue._initialized_lock:
+            if db_key not in ApprovalQueue._initialized:
+                self.ensure_tables()
+                ApprovalQueue._initialized.add(db_key)
+    
+    async def _conn(self) -> aiosqlite.Connection:
+        """Shared connection, opened and tuned on first use"""
+        if self._db is None:
+            async with self._db_lock:
+                if self._db is None:
+                    db = await aiosqlite.connect(self.db_path, cached_statements=STATEMENT_CACHE_SIZE)
+                    for pragma in CONNECTION_PRAGMAS:
+                        await db.execute(pragma)
+                    self._db = db
+        return self._db
+    
+    async def _queue_write(self, sql: str, rows: List[tuple],
+                           on_commit: Optional[Callable[[], Awaitable]] = None):
+        """Run a write as part of the next batch and wait for its commit
+        
+        rows holds one parameter tuple per statement execution. on_commit is
+        awaited by the writer after the batch commits, before callers resume.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending_writes.append((sql, rows, future, on_commit))
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._writer_loop())
+        await future
+    
+    async def _writer_loop(self):
+        """Sole writer: commit queued writes in batches until none are left
+        
+        Writes queued within WRITE_BATCH_WINDOW share one transaction, so a
+        bulk review costs one commit instead of one per item. BEGIN IMMEDIATE
+        takes the write lock up front instead of upgrading mid-transaction,
+        so batches never hit busy retries against each other. Consecutive
+        writes with the same SQL go through a single executemany; order is
+        kept. A write that fails is rolled back to its savepoint and only its
+        caller gets the error; the rest of the batch still commits.
+        """
+        while self._pending_writes:
+            await asyncio.sleep(WRITE_BATCH_WINDOW)
+            batch, self._pending_writes = self._pending_writes, []
+            failures: Dict[asyncio.Future, Exception] = {}
+            
+            try:
+                db = await self._conn()
+                await db.execute("BEGIN IMMEDIATE")
+                for sql, group in groupby(batch, key=lambda entry: entry[0]):
+                    group = list(group)
+                    try:
+                        await self._execute_in_savepoint(db, sql, [params for _, rows, _, _ in group for params in rows])
+                    except sqlite3.Error as e:
+                        if len(group) == 1:
+                            failures[group[0][2]] = e
+                            continue
+                        # Replay one by one to find the writes that fail
+                        for _, rows, future, _ in group:
+                            try:
+                                await self._execute_in_savepoint(db, sql, rows)
+                            except sqlite3.Error as e:
+                                failures[future] = e
+                await db.commit()
+            except Exception as e:
+                logger.error(f"Batched write of {len(batch)} operations failed: {e}")
+                if self._db is not None:
+                    await self._db.rollback()
+                for _, _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            if failures:
+                logger.error(f"{len(failures)} of {len(batch)} batched writes failed")
+            self._write_generation += 1
+            self._analytics_cache = None
+            self._json_cache.clear()
+            for _, _, future, on_commit in batch:
+                if on_commit is not None and future not in failures:
+                    try:
+                        await on_commit()
+                    except Exception as e:
+                        # The data is committed; rebuild the mirror on next read
+                        logger.warning(f"Pending mirror update failed, reloading it: {e}")
+                        self._pending_mirror = None
+            for _, _, future, _ in batch:
+                if future.done():
+                    continue
+                if future in failures:
+                    future.set_exception(failures[future])
+                else:
+                    future.set_result(None)
+    
+    @staticmethod
+    async def _execute_in_savepoint(db: aiosqlite.Connection, sql: str, rows: List[tuple]):
+        """executemany inside a savepoint, undoing just these rows if it fails"""
+        await db.execute("SAVEPOINT queued_write")
+        try:
+            await db.executemany(sql, rows)
+        except sqlite3.Error:
+            await db.execute("ROLLBACK TO queued_write")
+            raise
+        finally:
+            await db.execute("RELEASE queued_write")
+    
+    async def close(self):
+        """Close the shared connection (call on application shutdown)"""
+        if self._writer_task is not None:
+            await self._writer_task
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
     
     def ensure_tables(self):
         """Create database tables if they don't exist"""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         with sqlite3.connect(self.db_path) as conn:
+            # Larger pages fit more of these JSON-heavy rows per page
+            conn.execute(PAGE_SIZE_PRAGMA)
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS content_items (
                     id TEXT PRIMARY KEY,
@@ -76,154 +312,452 @@ class ApprovalQueue:
                     brand_compliance TEXT,
                     approval_feedback TEXT,
                     rejection_reason TEXT,
-                    edit_history TEXT
+                    edit_history TEXT,
+                    overall_quality REAL,
+                    source_category TEXT
                 )
             """)
+            self._add_filter_columns(conn)
+            # Status lists filter on status and sort by created_at; the
+            # recent-items view sorts by updated_at
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_items_status_created "
+                "ON content_items(status, created_at DESC)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_items_updated "
+                "ON content_items(updated_at DESC)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_items_quality "
+                "ON content_items(status, overall_quality DESC)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_items_source_category "
+                "ON content_items(source_category)"
+            )
+            # Per-status counters kept current by triggers, so counts are a
+            # primary-key lookup instead of an index scan
+            conn.executescript(f"""
+                CREATE TABLE IF NOT EXISTS content_status_counts (
+                    status TEXT PRIMARY KEY,
+                    n INTEGER NOT NULL
+                );
+                CREATE TRIGGER IF NOT EXISTS trg_items_ins AFTER INSERT ON content_items
+                BEGIN
+                    INSERT INTO content_status_counts (status, n) VALUES (NEW.status, 1)
+                    ON CONFLICT(status) DO UPDATE SET n = n + 1;
+                END;
+                CREATE TRIGGER IF NOT EXISTS trg_items_del AFTER DELETE ON content_items
+                BEGIN
+                    UPDATE content_status_counts SET n = n - 1 WHERE status = OLD.status;
+                END;
+                CREATE TRIGGER IF NOT EXISTS trg_items_upd AFTER UPDATE OF status ON content_items
+                WHEN OLD.status <> NEW.status
+                BEGIN
+                    UPDATE content_status_counts SET n = n - 1 WHERE status = OLD.status;
+                    INSERT INTO content_status_counts (status, n) VALUES (NEW.status, 1)
+                    ON CONFLICT(status) DO UPDATE SET n = n + 1;
+                END;
+                -- Stamp updated_at on any update that doesn't set it itself
+                CREATE TRIGGER IF NOT EXISTS trg_items_touch AFTER UPDATE ON content_items
+                FOR EACH ROW WHEN NEW.updated_at = OLD.updated_at
+                BEGIN
+                    UPDATE content_items SET updated_at = {SQL_NOW} WHERE rowid = NEW.rowid;
+                END;
+                -- Seed statuses that predate the counters; existing rows are
+                -- already maintained by the triggers
+                INSERT OR IGNORE INTO content_status_counts (status, n)
+                SELECT status, COUNT(*) FROM content_items GROUP BY status;
+            """)
+    
+    @staticmethod
+    def _add_filter_columns(conn: sqlite3.Connection):
+        """Add overall_quality/source_category to databases created before them
+        
+        Existing rows are backfilled once from whichever of their JSON blobs
+        exist (the dashboard's schema has no quality_scores column); afterwards
+        add_items writes the columns directly.
+        """
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(content_items)")}
+        if "overall_quality" in columns:
+            return
+        
+        def first_of(sources):
+            # Malformed JSON yields NULL rather than failing the migration
+            exprs = [
+                f"CASE WHEN json_valid({column}) THEN json_extract({column}, '{path}') END" if path else column
+                for column, path in sources if column in columns
+            ]
+            return f"coalesce({', '.join(exprs)}, NULL)" if exprs else "NULL"
+        
+        conn.execute("ALTER TABLE content_items ADD COLUMN overall_quality REAL")
+        conn.execute("ALTER TABLE content_items ADD COLUMN source_category TEXT")
+        conn.execute(f"""
+            UPDATE content_items SET
+                overall_quality = {first_of([("quality_scores", "$.overall"), ("metadata", "$.quality_scores.overall")])},
+                source_category = {first_of([("metadata", "$.source_category"), ("source", None)])}
+        """)
+    
+    @staticmethod
+    def _filter_fields(source: str, metadata: Dict) -> Tuple[Optional[float], str]:
+        """overall_quality and source_category for a new item, as the migration derives them"""
+        quality_scores = metadata.get("quality_scores")
+        overall = quality_scores.get("overall") if isinstance(quality_scores, dict) else None
+        return overall, metadata.get("source_category") or source
     
     async def add_item(self, content: str, content_type: str, source: str = "manual", metadata: Optional[Dict] = None) -> str:
         """Add new content item"""
-        item_id = str(uuid.uuid4())
-        now = datetime.now()
+        item_ids = await self.add_items([(content, content_type, source, metadata)])
+        return item_ids[0]
+    
+    async def add_items(self, items: List[Tuple[str, str, str, Optional[Dict]]]) -> List[str]:
+        """Add several (content, content_type, source, metadata) items in one transaction
+        
+        One executemany and a single commit, so bulk ingest pays for one WAL
+        flush instead of one per item.
+        """
+        rows = [
+            (str(uuid.uuid4()), content, content_type, "pending", source,
+             orjson.dumps(metadata or {}).decode(), "[]",
+             *self._filter_fields(source, metadata or {}))
+            for content, content_type, source, metadata in items
+        ]
         
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
-                INSERT INTO content_items (id, content, content_type, status, source, created_at, updated_at, metadata, edit_history)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (item_id, content, content_type, "pending", source, now.isoformat(), now.isoformat(), 
-                  json.dumps(metadata or {}), json.dumps([])))
-            await db.commit()
+        # Timestamps come from SQLite rather than a Python datetime per write
+        item_ids = [row[0] for row in rows]
+        await self._queue_write(SQL_INSERT_ITEM, rows, lambda: self._mirror_add(item_ids))
         
-        return item_id
+        return item_ids
     
     async def get_item(self, item_id: str) -> Optional[ContentItem]:
         """Get specific content item by ID"""
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute("SELECT * FROM content_items WHERE id = ?", (item_id,)) as cursor:
-                row = await cursor.fetchone()
-                if row:
-                    return self._row_to_content_item(row)
-                return None
+        db = await self._conn()
+        async with db.execute(SQL_SELECT_ITEM, (item_id,)) as cursor:
+            row = await cursor.fetchone()
+            if row:
+                return self._row_to_content_item(row)
+            return None
     
     async def get_recent_items(self, limit: int = 10) -> List[ContentItem]:
         """Get recent items"""
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute("SELECT * FROM content_items ORDER BY updated_at DESC LIMIT ?", (limit,)) as cursor:
-                rows = await cursor.fetchall()
-                return [self._row_to_content_item(row) for row in rows]
+        db = await self._conn()
+        async with db.execute("SELECT * FROM content_items ORDER BY updated_at DESC LIMIT ?", (limit,)) as cursor:
+            rows = await cursor.fetchall()
+            return [self._row_to_content_item(row) for row in rows]
+    
+    async def _count(self, status: ContentStatus) -> int:
+        """Read one status counter"""
+        db = await self._conn()
+        async with db.execute(SQL_SELECT_COUNT, (status.value,)) as cursor:
+            row = await cursor.fetchone()
+            return row[0] if row else 0
     
     async def get_pending_count(self) -> int:
         """Get count of pending items"""
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute("SELECT COUNT(*) FROM content_items WHERE status = 'pending'") as cursor:
-                row = await cursor.fetchone()
-                return row[0] if row else 0
+        return await self._count(ContentStatus.PENDING)
     
     async def get_approved_count(self) -> int:
         """Get count of approved items"""
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute("SELECT COUNT(*) FROM content_items WHERE status = 'approved'") as cursor:
-                row = await cursor.fetchone()
-                return row[0] if row else 0
+        return await self._count(ContentStatus.APPROVED)
     
     async def get_rejected_count(self) -> int:
         """Get count of rejected items"""
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute("SELECT COUNT(*) FROM content_items WHERE status = 'rejected'") as cursor:
-                row = await cursor.fetchone()
-                return row[0] if row else 0
+        return await self._count(ContentStatus.REJECTED)
     
     async def get_scheduled_count(self) -> int:
         """Get count of scheduled items"""
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute("SELECT COUNT(*) FROM content_items WHERE status = 'scheduled'") as cursor:
-                row = await cursor.fetchone()
-                return row[0] if row else 0
+        return await self._count(ContentStatus.SCHEDULED)
     
     async def get_published_count(self) -> int:
         """Get count of published items"""
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute("SELECT COUNT(*) FROM content_items WHERE status = 'published'") as cursor:
-                row = await cursor.fetchone()
-                return row[0] if row else 0
+        return await self._count(ContentStatus.PUBLISHED)
     
     async def approve_item(self, item_id: str, feedback: Optional[str] = None) -> bool:
         """Approve a content item"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
-                UPDATE content_items SET status = 'approved', approval_feedback = ?, updated_at = ?
-                WHERE id = ?
-            """, (feedback, datetime.now().isoformat(), item_id))
-            await db.commit()
-        return True
+        return await self.approve_items([item_id], feedback)
     
     async def reject_item(self, item_id: str, reason: str) -> bool:
         """Reject a content item"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
-                UPDATE content_items SET status = 'rejected', rejection_reason = ?, updated_at = ?
-                WHERE id = ?
-            """, (reason, datetime.now().isoformat(), item_id))
-            await db.commit()
+        return await self.reject_items([item_id], reason)
+    
+    async def approve_items(self, item_ids: List[str], feedback: Optional[str] = None) -> bool:
+        """Approve several content items with one UPDATE ... WHERE id IN (...)"""
+        await self._update_items(SQL_APPROVE_ITEMS, feedback, item_ids)
+        return True
+    
+    async def reject_items(self, item_ids: List[str], reason: str) -> bool:
+        """Reject several content items with one UPDATE ... WHERE id IN (...)"""
+        await self._update_items(SQL_REJECT_ITEMS, reason, item_ids)
         return True
     
+    async def _update_items(self, sql: str, value: Optional[str], item_ids: List[str]):
+        """Run a bulk UPDATE template over item_ids, chunked to MAX_SQL_VARIABLES
+        
+        All chunks are queued together, so they commit in the same transaction.
+        """
+        chunk_size = MAX_SQL_VARIABLES - 1  # one variable goes to value
+        await asyncio.gather(*(
+            self._queue_write(
+                sql.format(ids=",".join("?" * len(chunk))),
+                [(value, *chunk)],
+                lambda chunk=chunk: self._mirror_remove(chunk)
+            )
+            for chunk in (item_ids[i:i + chunk_size] for i in range(0, len(item_ids), chunk_size))
+        ))
+    
     async def edit_item(self, item_id: str, new_content: str, edit_notes: Optional[str] = None) -> bool:
-        """Edit content item"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
-                UPDATE content_items SET content = ?, status = 'edited', updated_at = ?
-                WHERE id = ?
-            """, (new_content, datetime.now().isoformat(), item_id))
-            await db.commit()
+        """Edit content item, recording the previous version in edit_history
+        
+        The history entry is appended by SQLite (JSON1) in the same UPDATE, so
+        the old content never has to be read back into Python.
+        """
+        await self._queue_write(SQL_EDIT_ITEM, [(new_content, edit_notes, item_id)],
+                                lambda: self._mirror_remove([item_id]))
         return True
     
+    async def get_status_counts(self) -> Dict[str, int]:
+        """Count items per status from the trigger-maintained counters"""
+        db = await self._conn()
+        async with db.execute("SELECT status, n FROM content_status_counts") as cursor:
+            rows = await cursor.fetchall()
+            return {status: count for status, count in rows}
+    
     async def get_analytics(self) -> Dict[str, Any]:
         """Get analytics"""
-        return {
-            "pending": await self.get_pending_count(),
-            "approved": await self.get_approved_count(),
-            "rejected": await self.get_rejected_count(),
-            "scheduled": await self.get_scheduled_count(),
-            "published": await self.get_published_count()
+        cached = self._analytics_cache
+        if cached and time.monotonic() - cached[0] < self._analytics_ttl:
+            return dict(cached[1])
+        
+        counts = await self.get_status_counts()
+        analytics = {
+            "pending": counts.get("pending", 0),
+            "approved": counts.get("approved", 0),
+            "rejected": counts.get("rejected", 0),
+            "scheduled": counts.get("scheduled", 0),
+            "published": counts.get("published", 0)
         }
+        self._analytics_cache = (time.monotonic(), analytics)
+        return dict(analytics)
     
-    async def get_pending_items(self, limit: int = 50) -> List[ContentItem]:
+    async def get_pending_items(self, limit: int = 50, raw: bool = False) -> List[ContentItem]:
         """Get all pending approval items"""
-        return await self._get_items_by_status(ContentStatus.PENDING, limit)
+        return await self._get_items_by_status(ContentStatus.PENDING, limit, raw)
     
-    async def get_approved_items(self, limit: int = 50) -> List[ContentItem]:
+    async def get_approved_items(self, limit: int = 50, raw: bool = False) -> List[ContentItem]:
         """Get all approved items"""
-        return await self._get_items_by_status(ContentStatus.APPROVED, limit)
+        return await self._get_items_by_status(ContentStatus.APPROVED, limit, raw)
     
-    async def get_rejected_items(self, limit: int = 50) -> List[ContentItem]:
+    async def get_rejected_items(self, limit: int = 50, raw: bool = False) -> List[ContentItem]:
         """Get all rejected items"""
-        return await self._get_items_by_status(ContentStatus.REJECTED, limit)
+        return await self._get_items_by_status(ContentStatus.REJECTED, limit, raw)
     
-    async def get_scheduled_items(self, limit: int = 50) -> List[ContentItem]:
+    async def get_scheduled_items(self, limit: int = 50, raw: bool = False) -> List[ContentItem]:
         """Get all scheduled items"""
-        return await self._get_items_by_status(ContentStatus.SCHEDULED, limit)
+        return await self._get_items_by_status(ContentStatus.SCHEDULED, limit, raw)
     
-    async def get_published_items(self, limit: int = 50) -> List[ContentItem]:
+    async def get_published_items(self, limit: int = 50, raw: bool = False) -> List[ContentItem]:
         """Get all published items"""
-        return await self._get_items_by_status(ContentStatus.PUBLISHED, limit)
+        return await self._get_items_by_status(ContentStatus.PUBLISHED, limit, raw)
     
-    async def get_all_items(self, limit: int = 100) -> List[ContentItem]:
+    async def get_all_items(self, limit: int = 100, raw: bool = False) -> List[ContentItem]:
         """Get all items regardless of status"""
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute("SELECT * FROM content_items ORDER BY created_at DESC LIMIT ?", (limit,)) as cursor:
-                rows = await cursor.fetchall()
-                return [self._row_to_content_item(row) for row in rows]
-    
-    async def _get_items_by_status(self, status: ContentStatus, limit: int) -> List[ContentItem]:
-        """Helper method to get items by status"""
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute("""
-                SELECT * FROM content_items 
-                WHERE status = ? 
-                ORDER BY created_at DESC 
-                LIMIT ?
-            """, (status.value, limit)) as cursor:
-                rows = await cursor.fetchall()
-                return [self._row_to_content_item(row) for row in rows]
+        db = await self._conn()
+        async with db.execute("SELECT * FROM content_items ORDER BY created_at DESC LIMIT ?", (limit,)) as cursor:
+            rows = await cursor.fetchall()
+            convert = self._row_to_dict if raw else self._row_to_content_item
+            return [convert(row) for row in rows]
+    
+    async def get_top_quality_items(self, status: ContentStatus = ContentStatus.PENDING, limit: int = 50,
+                                    min_quality: float = 0.0) -> List[ContentItem]:
+        """Items with a status, best overall quality first (unscored items excluded)"""
+        db = await self._conn()
+        async with db.execute("""
+            SELECT * FROM content_items
+            WHERE status = ? AND overall_quality >= ?
+            ORDER BY overall_quality DESC
+            LIMIT ?
+        """, (status.value, min_quality, limit)) as cursor:
+            rows = await cursor.fetchall()
+            return [self._row_to_content_item(row) for row in rows]
+    
+    async def _get_items_by_status(self, status: ContentStatus, limit: int, raw: bool = False) -> List[ContentItem]:
+        """Helper method to get items by status
+        
+        With raw=True rows come back as plain dicts (see _row_to_dict) instead
+        of ContentItems, for callers that only pass them on as JSON.
+        """
+        db = await self._conn()
+        async with db.execute(SQL_SELECT_BY_STATUS, (status.value, limit)) as cursor:
+            rows = await cursor.fetchall()
+            convert = self._row_to_dict if raw else self._row_to_content_item
+            return [convert(row) for row in rows]
+
+    async def iter_items_by_status(self, status: ContentStatus, limit: int = 50) -> AsyncIterator[ContentItem]:
+        """Yield items with a status as rows arrive, newest first
+        
+        Unlike the get_*_items lists, rows are never all held at once, so a
+        streaming response can start before the query finishes.
+        """
+        db = await self._conn()
+        async with db.execute(SQL_SELECT_BY_STATUS, (status.value, limit)) as cursor:
+            async for row in cursor:
+                yield self._row_to_content_item(row)
+    
+    async def get_pending_summaries(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Pending items for list views: id, type, status, creation time and a preview
+        
+        Projects only these columns so the full content and JSON blobs are not
+        copied out or decoded; use get_item() for the detail view. With the
+        pending mirror on, this is answered from memory after the first call.
+        """
+        if self._use_pending_mirror:
+            mirror = self._pending_mirror
+            if mirror is None or await self._data_version() != self._mirror_data_version:
+                mirror = await self._load_pending_mirror()
+            ids, content_types = mirror["id"], mirror["content_type"]
+            created, updated, previews = mirror["created_at"], mirror["updated_at"], mirror["preview"]
+            status = ContentStatus.PENDING.value
+            return [
+                {"id": ids[i], "content_type": content_types[i], "status": status,
+                 "created_at": created[i], "updated_at": updated[i], "preview": previews[i]}
+                for i in range(len(ids) - 1, max(len(ids) - limit, 0) - 1, -1)
+            ]
+        
+        db = await self._conn()
+        async with db.execute(SQL_SELECT_SUMMARIES_BY_STATUS, (SUMMARY_PREVIEW_CHARS, ContentStatus.PENDING.value, limit)) as cursor:
+            rows = await cursor.fetchall()
+            return [self._row_to_summary(row) for row in rows]
+    
+    async def _load_pending_mirror(self) -> Dict[str, list]:
+        """Read every pending summary into parallel columns, oldest first
+        
+        The result is only kept if no write committed while it was read;
+        otherwise it is used once and the next call reloads.
+        """
+        generation = self._write_generation
+        # Read first: a commit by another connection during the SELECT then
+        # shows up as a newer version on the next call
+        data_version = await self._data_version()
+        db = await self._conn()
+        async with db.execute("""
+            SELECT id, content_type, created_at, updated_at, substr(content, 1, ?)
+            FROM content_items
+            WHERE status = ?
+            ORDER BY created_at
+        """, (SUMMARY_PREVIEW_CHARS, ContentStatus.PENDING.value)) as cursor:
+            rows = await cursor.fetchall()
+        
+        columns = list(zip(*rows)) or [()] * len(PENDING_MIRROR_COLUMNS)
+        mirror = {
+            name: list(column)
+            for name, column in zip(PENDING_MIRROR_COLUMNS, columns)
+        }
+        if generation == self._write_generation:
+            self._pending_mirror = mirror
+            self._mirror_data_version = data_version
+        return mirror
+    
+    async def _data_version(self) -> int:
+        """SQLite's data_version: changes when another connection commits to the file"""
+        db = await self._conn()
+        async with db.execute("PRAGMA data_version") as cursor:
+            row = await cursor.fetchone()
+            return row[0]
+    
+    async def _mirror_add(self, item_ids: List[str]):
+        """Append newly inserted items to the pending mirror (writer only)"""
+        mirror = self._pending_mirror
+        if mirror is None:
+            return
+        
+        db = await self._conn()
+        rows = []
+        for i in range(0, len(item_ids), MAX_SQL_VARIABLES - 1):
+            chunk = item_ids[i:i + MAX_SQL_VARIABLES - 1]
+            async with db.execute(f"""
+                SELECT id, content_type, created_at, updated_at, substr(content, 1, ?)
+                FROM content_items
+                WHERE id IN ({",".join("?" * len(chunk))}) AND status = ?
+            """, (SUMMARY_PREVIEW_CHARS, *chunk, ContentStatus.PENDING.value)) as cursor:
+                rows.extend(await cursor.fetchall())
+        
+        rows.sort(key=lambda row: row[2])
+        for name, column in zip(PENDING_MIRROR_COLUMNS, zip(*rows)):
+            mirror[name].extend(column)
+    
+    async def _mirror_remove(self, item_ids: List[str]):
+        """Drop items that left the pending status from the mirror (writer only)"""
+        mirror = self._pending_mirror
+        if mirror is None:
+            return
+        
+        removed = set(item_ids)
+        keep = [i for i, item_id in enumerate(mirror["id"]) if item_id not in removed]
+        if len(keep) == len(mirror["id"]):
+            return
+        for name, column in mirror.items():
+            mirror[name] = [column[i] for i in keep]
+    
+    async def get_recent_summaries(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Most recently updated items, in the same summary form"""
+        db = await self._conn()
+        async with db.execute("""
+            SELECT id, content_type, status, created_at, updated_at, substr(content, 1, ?)
+            FROM content_items
+            ORDER BY updated_at DESC
+            LIMIT ?
+        """, (SUMMARY_PREVIEW_CHARS, limit)) as cursor:
+            rows = await cursor.fetchall()
+            return [self._row_to_summary(row) for row in rows]
+    
+    async def get_pending_items_json(self, limit: int = 50) -> bytes:
+        """Pending items as a ready-to-send JSON array (ContentItem.dict() form)"""
+        data_version = await self._data_version()
+        if data_version != self._json_cache_data_version:
+            self._json_cache.clear()
+            self._json_cache_data_version = data_version
+        db = await self._conn()
+        async with db.execute(SQL_SELECT_BY_STATUS, (ContentStatus.PENDING.value, limit)) as cursor:
+            rows = await cursor.fetchall()
+        return b"[" + b",".join(self._item_json(row) for row in rows) + b"]"
+    
+    def _item_json(self, row) -> bytes:
+        """Encoded JSON for a row, reused while the row is unchanged"""
+        key = (row[0], row[6])
+        encoded = self._json_cache.get(key)
+        if encoded is not None:
+            self._json_cache.move_to_end(key)
+            return encoded
+        
+        encoded = orjson.dumps(self._row_to_content_item(row))
+        self._json_cache[key] = encoded
+        if len(self._json_cache) > JSON_CACHE_SIZE:
+            self._json_cache.popitem(last=False)
+        return encoded
+    
+    def _row_to_summary(self, row) -> Dict[str, Any]:
+        """Convert a summary projection row to a dict"""
+        return {
+            "id": row[0], "content_type": row[1], "status": row[2],
+            "created_at": row[3], "updated_at": row[4], "preview": row[5]
+        }
+    
+    def _row_to_dict(self, row) -> Dict[str, Any]:
+        """Convert database row to a plain dict without parsing anything
+        
+        Timestamps stay ISO strings and the JSON columns stay encoded under
+        *_json keys, so a response can embed them without a decode/encode trip.
+        """
+        return {
+            "id": row[0], "content": row[1], "content_type": row[2],
+            "status": row[3], "source": row[4],
+            "created_at": row[5], "updated_at": row[6],
+            "metadata_json": row[7], "quality_scores_json": row[8],
+            "brand_compliance_json": row[9],
+            "approval_feedback": row[10], "rejection_reason": row[11],
+            "edit_history_json": row[12]
+        }
 
     def _row_to_content_item(self, row) -> ContentItem:
         """Convert database row to ContentItem"""
@@ -232,9 +766,9 @@ class ApprovalQueue:
             status=ContentStatus(row[3]), source=row[4],
             created_at=datetime.fromisoformat(row[5]),
             updated_at=datetime.fromisoformat(row[6]),
-            metadata=json.loads(row[7]) if row[7] else {},
-            quality_scores=json.loads(row[8]) if row[8] else None,
-            brand_compliance=json.loads(row[9]) if row[9] else None,
+            metadata=orjson.loads(row[7]) if row[7] else {},
+            quality_scores=orjson.loads(row[8]) if row[8] else None,
+            brand_compliance=orjson.loads(row[9]) if row[9] else None,
             approval_feedback=row[10], rejection_reason=row[11],
-            edit_history=json.loads(row[12]) if row[12] else []
+            edit_history=orjson.loads(row[12]) if row[12] else []
         )
\ No newline at end of file
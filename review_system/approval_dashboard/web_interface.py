@@ -7,7 +7,7 @@ from fastapi import FastAPI, Request, Form, HTTPException
 from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 from datetime import datetime
 import json
 import logging
@@ -16,6 +16,9 @@ from pathlib import Path
 import aiosqlite
 import uuid
 import asyncio
+import hashlib
+import time
+from functools import lru_cache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -78,8 +81,41 @@ class FixedAIContentGenerator:
         else:
             self.provider = "simulation"
         
+        # Optional on-disk cache of generated tweets (see enable_cache)
+        self.cache_dir = None
+        self.cache_ttl = 3600
+        
         logger.info(f"AI Generator initialized: {self.provider}")
     
+    def enable_cache(self, cache_dir: str = "data/ai_cache", ttl: int = 3600):
+        """Cache generated tweets on disk, keyed by topic, tone and hashtag flag"""
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_ttl = ttl
+    
+    def clear_cache(self):
+        """Remove all cached generations"""
+        if self.cache_dir:
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+    
+    def _cache_path(self, topic: str, tone: str, include_hashtags: bool) -> Path:
+        """Cache file for a set of generation inputs"""
+        key = hashlib.sha256(json.dumps(
+            {"topic": topic, "tone": tone, "hashtags": include_hashtags}, sort_keys=True
+        ).encode()).hexdigest()
+        return self.cache_dir / f"{key}.json"
+    
+    def _read_cache(self, path: Path) -> Optional[dict]:
+        """Return a cached result if it exists and has not expired"""
+        try:
+            if time.time() - path.stat().st_mtime > self.cache_ttl:
+                return None
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
     def _init_openai(self):
         """Initialize OpenAI"""
         try:
@@ -100,18 +136,40 @@ class FixedAIContentGenerator:
             logger.error(f"Anthropic initialization failed: {e}")
             self.provider = "simulation"
     
-    async def generate_tweet(self, topic: str, tone: str = "professional", include_hashtags: bool = True) -> dict:
-        """Generate tweet content"""
+    async def generate_tweet(self, topic: str, tone: str = "professional", include_hashtags: bool = True,
+                             use_cache: bool = True) -> dict:
+        """Generate tweet content
+        
+        use_cache=False skips the on-disk cache for content that gets
+        published, since Twitter rejects a repeat of an earlier tweet.
+        """
+        cache_path = None
+        if use_cache and self.cache_dir and self.provider != "simulation":
+            cache_path = self._cache_path(topic, tone, include_hashtags)
+            cached = self._read_cache(cache_path)
+            if cached:
+                return cached
+        
         try:
             if self.provider == "openai":
-                return await self._generate_openai(topic, tone, include_hashtags)
+                result = await self._generate_openai(topic, tone, include_hashtags)
             elif self.provider == "anthropic":
-                return await self._generate_anthropic(topic, tone, include_hashtags)
+                result = await self._generate_anthropic(topic, tone, include_hashtags)
             else:
                 return self._generate_simulation(topic, tone, include_hashtags)
         except Exception as e:
             logger.error(f"Tweet generation failed: {e}")
             return self._generate_simulation(topic, tone, include_hashtags)
+        
+        # Only real provider output is worth caching
+        if cache_path and result.get("success") and result.get("provider") == self.provider:
+            try:
+                with open(cache_path, 'w') as f:
+                    json.dump(result, f)
+            except OSError as e:
+                logger.warning(f"Could not write AI cache entry: {e}")
+        
+        return result
     
     async def _generate_openai(self, topic: str, tone: str, include_hashtags: bool) -> dict:
         """Generate using OpenAI"""
@@ -280,6 +338,7 @@ class FixedTwitterPublisher:
         self.client = None
         self.api_v1 = None
         self.connected = False
+        self._status = None
         
         if self._has_credentials():
             self._init_client()
@@ -292,6 +351,7 @@ class FixedTwitterPublisher:
     
     def _init_client(self):
         """Initialize Twitter client"""
+        self._status = None
         try:
             import tweepy
             
@@ -320,8 +380,8 @@ class FixedTwitterPublisher:
         """Publish tweet"""
         try:
             if self.connected and self.api_v1:
-                # Use v1.1 API for posting
-                tweet = self.api_v1.update_status(content)
+                # Use v1.1 API for posting - tweepy blocks, so run it in a thread
+                tweet = await asyncio.to_thread(self.api_v1.update_status, content)
                 
                 # Get tweet URL
                 user_screen_name = tweet.user.screen_name
@@ -358,19 +418,21 @@ class FixedTwitterPublisher:
             }
     
     def get_status(self) -> dict:
-        """Get Twitter status"""
-        return {
-            "connected": self.connected,
-            "configured": self._has_credentials(),
-            "mode": "live" if self.connected else "simulation",
-            "credentials_present": {
-                "api_key": bool(self.api_key),
-                "api_secret": bool(self.api_secret),
-                "access_token": bool(self.access_token),
-                "access_token_secret": bool(self.access_token_secret),
-                "bearer_token": bool(self.bearer_token)
+        """Get Twitter status (computed once per client initialization)"""
+        if self._status is None:
+            self._status = {
+                "connected": self.connected,
+                "configured": self._has_credentials(),
+                "mode": "live" if self.connected else "simulation",
+                "credentials_present": {
+                    "api_key": bool(self.api_key),
+                    "api_secret": bool(self.api_secret),
+                    "access_token": bool(self.access_token),
+                    "access_token_secret": bool(self.access_token_secret),
+                    "bearer_token": bool(self.bearer_token)
+                }
             }
-        }
+        return self._status
 
 # Fixed Approval Queue
 class FixedApprovalQueue:
@@ -423,7 +485,33 @@ class FixedApprovalQueue:
         
         logger.info(f"Added content item: {item_id}")
         return item_id
-    
+
+    async def add_approved_item(self, content: str, content_type: str = "tweet", source: str = "manual",
+                                feedback: str = None, metadata: dict = None) -> dict:
+        """Add a content item that is approved on submission
+
+        One INSERT ... RETURNING in one transaction, in place of add_item,
+        approve_item and a get_item to read the row back.
+        """
+        item_id = str(uuid.uuid4())
+        now = datetime.now().isoformat()
+
+        async with aiosqlite.connect(self.db_path) as db:
+            async with db.execute("""
+                INSERT INTO content_items
+                (id, content, content_type, status, source, created_at, updated_at, metadata, approval_feedback)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                RETURNING *
+            """, (
+                item_id, content, content_type, "approved", source,
+                now, now, json.dumps(metadata or {}), feedback
+            )) as cursor:
+                row = await cursor.fetchone()
+            await db.commit()
+
+        logger.info(f"Added approved content item: {item_id}")
+        return self._row_to_dict(row)
+
     async def get_item(self, item_id: str) -> dict:
         """Get content item"""
         async with aiosqlite.connect(self.db_path) as db:
@@ -463,6 +551,13 @@ class FixedApprovalQueue:
                 row = await cursor.fetchone()
                 return row[0] if row else 0
     
+    async def get_status_counts(self, statuses: Sequence[str]) -> Dict[str, int]:
+        """Get counts for several statuses with one GROUP BY query"""
+        async with aiosqlite.connect(self.db_path) as db:
+            async with db.execute("SELECT status, COUNT(*) FROM content_items GROUP BY status") as cursor:
+                counts = dict(await cursor.fetchall())
+        return {status: counts.get(status, 0) for status in statuses}
+    
     async def approve_item(self, item_id: str, feedback: str = None) -> bool:
         """Approve item"""
         async with aiosqlite.connect(self.db_path) as db:
@@ -524,11 +619,35 @@ class FixedApprovalQueue:
 
 # Initialize all components
 ai_generator = FixedAIContentGenerator()
-twitter_publisher = FixedTwitterPublisher()
 approval_queue = FixedApprovalQueue()
 content_scorer = ContentScorer()
 brand_checker = BrandVoiceChecker()
 
+@lru_cache(maxsize=1)
+def get_twitter_publisher() -> FixedTwitterPublisher:
+    """Shared Twitter publisher, created on first use
+    
+    Construction verifies credentials against the API, so it is deferred
+    until a route or test actually needs Twitter rather than run on import.
+    """
+    return FixedTwitterPublisher()
+
+async def get_twitter_publisher_async() -> FixedTwitterPublisher:
+    """get_twitter_publisher() for async code: the first call builds the
+    publisher in a worker thread, so the blocking credential check never
+    stalls the event loop
+    """
+    if get_twitter_publisher.cache_info().currsize:
+        return get_twitter_publisher()
+    return await asyncio.to_thread(get_twitter_publisher)
+
+def __getattr__(name):
+    # Keep `from ... import twitter_publisher` working without connecting
+    # at import time
+    if name == "twitter_publisher":
+        return get_twitter_publisher()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # FastAPI app initialization
 app = FastAPI(
     title="Freyja Dashboard",
@@ -536,6 +655,17 @@ app = FastAPI(
     version="1.0.0"
 )
 
+@app.on_event("startup")
+async def build_twitter_publisher():
+    """Connect to Twitter while the server starts rather than on the first request"""
+    await get_twitter_publisher_async()
+
+@app.on_event("shutdown")
+async def close_twitter_http():
+    """Close the pooled Twitter HTTP client's keep-alive connections"""
+    from publishing import twitter_http
+    await twitter_http.aclose()
+
 # Setup templates with error handling
 templates_dir = Path("review_system/approval_dashboard/templates")
 templates_dir.mkdir(parents=True, exist_ok=True)
@@ -552,13 +682,9 @@ async def dashboard_home(request: Request):
     """Main dashboard with fallback HTML"""
     try:
         # Get statistics
-        stats = {
-            "pending": await approval_queue.get_count_by_status("pending"),
-            "approved": await approval_queue.get_count_by_status("approved"),
-            "rejected": await approval_queue.get_count_by_status("rejected"),
-            "published": await approval_queue.get_count_by_status("published"),
-            "scheduled": await approval_queue.get_count_by_status("scheduled")
-        }
+        stats = await approval_queue.get_status_counts(
+            ("pending", "approved", "rejected", "published", "scheduled")
+        )
         stats["total"] = sum(stats.values())
         
         # Get recent items
@@ -812,13 +938,9 @@ async def review_queue(request: Request, status: str = "pending"):
 async def analytics_dashboard(request: Request):
     """Analytics dashboard with fallback"""
     try:
-        analytics = {
-            "pending": await approval_queue.get_count_by_status("pending"),
-            "approved": await approval_queue.get_count_by_status("approved"),
-            "rejected": await approval_queue.get_count_by_status("rejected"),
-            "scheduled": await approval_queue.get_count_by_status("scheduled"),
-            "published": await approval_queue.get_count_by_status("published")
-        }
+        analytics = await approval_queue.get_status_counts(
+            ("pending", "approved", "rejected", "scheduled", "published")
+        )
         
         if templates:
             return templates.TemplateResponse("analytics.html", {
@@ -829,6 +951,7 @@ async def analytics_dashboard(request: Request):
             # Fallback HTML
             total = sum(analytics.values())
             approval_rate = (analytics['approved'] / max(total, 1)) * 100
+            twitter_connected = (await get_twitter_publisher_async()).connected
             
             return HTMLResponse(f"""
             <!DOCTYPE html>
@@ -875,7 +998,7 @@ async def analytics_dashboard(request: Request):
                     <p>✅ Content Review System: Active</p>
                     <p>✅ Database: Connected</p>
                     <p>🤖 AI Generator: {ai_generator.provider.title()} Mode</p>
-                    <p>🐦 Twitter: {'Connected' if twitter_publisher.connected else 'Simulation Mode'}</p>
+                    <p>🐦 Twitter: {'Connected' if twitter_connected else 'Simulation Mode'}</p>
                 </div>
             </body></html>
             """)
@@ -939,7 +1062,7 @@ async def get_ai_status():
 async def get_twitter_status():
     """Twitter status API"""
     try:
-        return twitter_publisher.get_status()
+        return (await get_twitter_publisher_async()).get_status()
     except Exception as e:
         logger.error(f"Twitter status error: {e}")
         return {"error": str(e), "connected": False}
@@ -977,7 +1100,7 @@ async def publish_content(item_id: str):
             raise HTTPException(status_code=400, detail="Only approved content can be published")
         
         # Publish to Twitter
-        result = await twitter_publisher.publish_tweet(item["content"])
+        result = await (await get_twitter_publisher_async()).publish_tweet(item["content"])
         
         if result["success"]:
             # Mark as published
@@ -1093,7 +1216,7 @@ async def health_check():
         ai_status = ai_generator.get_status()
         
         # Get Twitter status
-        twitter_status = twitter_publisher.get_status()
+        twitter_status = (await get_twitter_publisher_async()).get_status()
         
         return {
             "status": "healthy",
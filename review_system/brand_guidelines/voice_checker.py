@@ -10,6 +10,8 @@ from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+HASHTAG_RE = re.compile(r'#\w+')
+
 class ComplianceLevel(Enum):
     COMPLIANT = "compliant"
     WARNING = "warning"
@@ -52,7 +54,8 @@ class BrandVoiceChecker:
         if len(content) > char_limit:
             issues.append(f"Content exceeds {char_limit} character limit")
         
-        hashtags = re.findall(r'#\w+', content)
+        # A substring test is far cheaper than a regex scan on the common hashtag-free path
+        hashtags = HASHTAG_RE.findall(content) if '#' in content else []
         if len(hashtags) > self.brand_config["guidelines"]["max_hashtags"]:
             issues.append("Too many hashtags")
         
@@ -119,7 +119,7 @@ async def test_components():
     
     try:
         # Test web interface import
-        from review_system.approval_dashboard.web_interface import app, ai_generator, twitter_publisher, approval_queue
+        from review_system.approval_dashboard.web_interface import app, ai_generator, get_twitter_publisher_async, approval_queue
         print("   ✅ Web interface loaded")
         
         # Test database
@@ -134,7 +134,7 @@ async def test_components():
         print(f"   ✅ AI Generator: {status['provider']} mode")
         
         # Test Twitter publisher
-        twitter_status = twitter_publisher.get_status()
+        twitter_status = (await get_twitter_publisher_async()).get_status()
         print(f"   ✅ Twitter Publisher: {twitter_status['mode']} mode")
         
         return True
@@ -0,0 +1,248 @@
+"""
+Tests for the approval queue's batched writer
+"""
+
+import asyncio
+import sqlite3
+
+import orjson
+import pytest
+import pytest_asyncio
+
+from review_system.approval_dashboard.approval_queue import ApprovalQueue, ContentStatus
+
+
+@pytest_asyncio.fixture
+async def queue(tmp_path):
+    approval_queue = ApprovalQueue(str(tmp_path / "queue.db"))
+    yield approval_queue
+    await approval_queue.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_write_only_fails_its_caller(queue):
+    first, second = await queue.add_items([("one", "tweet", "test", None), ("two", "tweet", "test", None)])
+
+    # content is NOT NULL, so the edit fails inside the same batch as the approval
+    approved, edited = await asyncio.gather(
+        queue.approve_item(first, "ok"),
+        queue.edit_item(second, None),
+        return_exceptions=True
+    )
+
+    assert approved is True
+    assert isinstance(edited, sqlite3.IntegrityError)
+    assert (await queue.get_item(first)).status == ContentStatus.APPROVED
+    assert (await queue.get_item(second)).status == ContentStatus.PENDING
+
+
+@pytest.mark.asyncio
+async def test_failed_write_in_a_grouped_executemany_is_isolated(queue):
+    first, second = await queue.add_items([("one", "tweet", "test", None), ("two", "tweet", "test", None)])
+
+    # Same SQL, so both edits start out in one executemany
+    bad, good = await asyncio.gather(
+        queue.edit_item(first, None),
+        queue.edit_item(second, "two, edited"),
+        return_exceptions=True
+    )
+
+    assert isinstance(bad, sqlite3.IntegrityError)
+    assert good is True
+    assert (await queue.get_item(first)).content == "one"
+    assert (await queue.get_item(second)).content == "two, edited"
+
+
+@pytest.mark.asyncio
+async def test_batched_writes_commit_together(queue):
+    item_ids = await queue.add_items([(f"item {i}", "tweet", "test", None) for i in range(20)])
+
+    await asyncio.gather(
+        *(queue.approve_item(item_id) for item_id in item_ids[:10]),
+        queue.reject_item(item_ids[10], "off brand"),
+        queue.edit_item(item_ids[11], "rewritten")
+    )
+
+    assert await queue.get_approved_count() == 10
+    assert await queue.get_rejected_count() == 1
+    assert await queue.get_pending_count() == 8
+    edited = await queue.get_item(item_ids[11])
+    assert edited.status == ContentStatus.EDITED
+    assert edited.edit_history[0]["previous_content"] == "item 11"
+
+
+def _create_legacy_table(path, columns):
+    with sqlite3.connect(path) as conn:
+        conn.execute(f"CREATE TABLE content_items ({columns})")
+
+
+@pytest.mark.asyncio
+async def test_filter_columns_backfilled_from_json(tmp_path):
+    path = str(tmp_path / "legacy.db")
+    _create_legacy_table(path, """
+        id TEXT PRIMARY KEY, content TEXT NOT NULL, content_type TEXT NOT NULL,
+        status TEXT NOT NULL, source TEXT NOT NULL, created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL, metadata TEXT, quality_scores TEXT,
+        brand_compliance TEXT, approval_feedback TEXT, rejection_reason TEXT,
+        edit_history TEXT
+    """)
+    with sqlite3.connect(path) as conn:
+        conn.execute("""
+            INSERT INTO content_items VALUES ('scored', 'x', 'tweet', 'pending', 'ai',
+                '2025-01-01T00:00:00', '2025-01-01T00:00:00', '{"source_category": "news"}',
+                '{"overall": 0.7}', NULL, NULL, NULL, '[]')
+        """)
+
+    queue = ApprovalQueue(path)
+    try:
+        new_id = await queue.add_item("y", "tweet", "rss", {"quality_scores": {"overall": 0.9}})
+        top = await queue.get_top_quality_items()
+        assert [item.id for item in top] == [new_id, "scored"]
+    finally:
+        await queue.close()
+
+    with sqlite3.connect(path) as conn:
+        rows = dict(conn.execute("SELECT id, source_category FROM content_items"))
+    assert rows == {"scored": "news", new_id: "rss"}
+
+
+def test_dashboard_schema_database_opens(tmp_path):
+    # The schema FixedApprovalQueue creates: no quality_scores column
+    path = str(tmp_path / "dashboard.db")
+    _create_legacy_table(path, """
+        id TEXT PRIMARY KEY, content TEXT NOT NULL,
+        content_type TEXT NOT NULL DEFAULT 'tweet', status TEXT NOT NULL DEFAULT 'pending',
+        source TEXT NOT NULL DEFAULT 'manual', created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL, metadata TEXT DEFAULT '{}',
+        approval_feedback TEXT, rejection_reason TEXT
+    """)
+    with sqlite3.connect(path) as conn:
+        conn.execute("""
+            INSERT INTO content_items (id, content, status, created_at, updated_at, metadata)
+            VALUES ('a', 'x', 'pending', '2025-01-01T00:00:00', '2025-01-01T00:00:00', 'not json')
+        """)
+
+    ApprovalQueue(path)
+
+    with sqlite3.connect(path) as conn:
+        row = conn.execute("SELECT overall_quality, source_category FROM content_items").fetchone()
+    assert row == (None, "manual")
+
+
+@pytest.mark.asyncio
+async def test_pending_mirror_matches_database(tmp_path):
+    path = str(tmp_path / "mirror.db")
+    queue = ApprovalQueue(path)
+    reference = ApprovalQueue(path, pending_mirror=False)
+    try:
+        item_ids = await queue.add_items([(f"item {i}", "tweet", "test", None) for i in range(30)])
+        await queue.get_pending_summaries()  # load the mirror
+
+        await queue.approve_items(item_ids[:5])
+        await queue.reject_item(item_ids[5], "off brand")
+        await queue.edit_item(item_ids[6], "rewritten")
+        late_id = await queue.add_item("late", "tweet")
+
+        mirrored = await queue.get_pending_summaries(100)
+        expected = await reference.get_pending_summaries(100)
+        assert {item["id"] for item in mirrored} == {item["id"] for item in expected}
+        assert len(mirrored) == 24
+        assert mirrored[0]["id"] == late_id
+    finally:
+        await queue.close()
+        await reference.close()
+
+
+@pytest.mark.asyncio
+async def test_pending_mirror_sees_writes_from_other_connections(queue):
+    item_id = await queue.add_item("one", "tweet")
+    assert [item["id"] for item in await queue.get_pending_summaries()] == [item_id]
+
+    # As FixedApprovalQueue does: its own connection, outside the writer task
+    with sqlite3.connect(queue.db_path) as conn:
+        conn.execute("UPDATE content_items SET status = 'approved' WHERE id = ?", (item_id,))
+
+    assert await queue.get_pending_summaries() == []
+
+
+@pytest.mark.asyncio
+async def test_pending_mirror_drops_failed_writes(queue):
+    first, second = await queue.add_items([("one", "tweet", "test", None), ("two", "tweet", "test", None)])
+    await queue.get_pending_summaries()
+
+    await asyncio.gather(queue.approve_item(first), queue.edit_item(second, None), return_exceptions=True)
+
+    assert [item["id"] for item in await queue.get_pending_summaries()] == [second]
+
+
+@pytest.mark.asyncio
+async def test_item_json_not_stale_after_same_millisecond_write(queue):
+    item_id = await queue.add_item("one", "tweet")
+    # Without the touch trigger updated_at stays put, as it does when a
+    # second write lands within the same millisecond
+    with sqlite3.connect(queue.db_path) as conn:
+        conn.execute("DROP TRIGGER trg_items_touch")
+    assert orjson.loads(await queue.get_pending_items_json())[0]["content"] == "one"
+
+    await queue._queue_write("UPDATE content_items SET content = 'two' WHERE id = ?", [(item_id,)])
+    assert orjson.loads(await queue.get_pending_items_json())[0]["content"] == "two"
+
+    with sqlite3.connect(queue.db_path) as conn:
+        conn.execute("UPDATE content_items SET content = 'three' WHERE id = ?", (item_id,))
+    assert orjson.loads(await queue.get_pending_items_json())[0]["content"] == "three"
+
+
+def _counted(path):
+    with sqlite3.connect(path) as conn:
+        counters = dict(conn.execute("SELECT status, n FROM content_status_counts WHERE n > 0"))
+        actual = dict(conn.execute("SELECT status, COUNT(*) FROM content_items GROUP BY status"))
+    return counters, actual
+
+
+@pytest.mark.asyncio
+async def test_status_counters_follow_every_write(queue):
+    item_ids = await queue.add_items([(f"item {i}", "tweet", "test", None) for i in range(6)])
+    await queue.approve_items(item_ids[:2])
+    await queue.reject_item(item_ids[2], "off brand")
+    await queue.edit_item(item_ids[3], "rewritten")
+    await queue.approve_item(item_ids[0])  # no status change
+
+    with sqlite3.connect(queue.db_path) as conn:
+        conn.execute("DELETE FROM content_items WHERE id = ?", (item_ids[5],))
+
+    counters, actual = _counted(queue.db_path)
+    assert counters == actual == {"pending": 1, "approved": 2, "rejected": 1, "edited": 1}
+    status_counts = await queue.get_status_counts()
+    assert {status: n for status, n in status_counts.items() if n} == actual
+    assert await queue.get_pending_count() == 1
+    assert await queue.get_scheduled_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_status_counters_unchanged_by_failed_writes(queue):
+    first, second = await queue.add_items([("one", "tweet", "test", None), ("two", "tweet", "test", None)])
+
+    await asyncio.gather(queue.approve_item(first), queue.edit_item(second, None), return_exceptions=True)
+
+    counters, actual = _counted(queue.db_path)
+    assert counters == actual == {"pending": 1, "approved": 1}
+
+
+def test_status_counters_seeded_from_existing_rows(tmp_path):
+    path = str(tmp_path / "existing.db")
+    ApprovalQueue(path)
+    with sqlite3.connect(path) as conn:
+        # A database from before the counters: no table, no triggers
+        conn.execute("DROP TABLE content_status_counts")
+        for trigger in ("trg_items_ins", "trg_items_del", "trg_items_upd"):
+            conn.execute(f"DROP TRIGGER {trigger}")
+        conn.executemany("""
+            INSERT INTO content_items (id, content, content_type, status, source, created_at, updated_at)
+            VALUES (?, 'x', 'tweet', ?, 'test', '2025-01-01T00:00:00', '2025-01-01T00:00:00')
+        """, [("a", "pending"), ("b", "pending"), ("c", "published")])
+    ApprovalQueue._initialized.discard(path)
+
+    ApprovalQueue(path)
+
+    counters, actual = _counted(path)
+    assert counters == actual == {"pending": 2, "published": 1}